@@ -5,38 +5,52 @@ Displays PNG/GIF mascot with real transparency - no background window.
 """
 
 import atexit
-import io
 import json
 import math
 import os
+import queue
 import random
+import re
+import select
+import selectors
 import signal
 import socket
+import struct
 import sys
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from PIL import Image, ImageFilter
+from PIL import Image, ImageChops
+
+try:
+    import orjson  # Optional: faster JSON for the socket protocol
+except ImportError:
+    orjson = None
 
 try:
     import objc
     from AppKit import (
         NSWorkspace, NSFont, NSFontAttributeName,
         NSForegroundColorAttributeName, NSEvent,
-        NSSound,
+        NSSound, NSViewLayerContentsRedrawOnSetNeedsDisplay,
+        NSWorkspaceApplicationKey,
     )
     from Cocoa import (
         NSApplication, NSWindow, NSView, NSImage, NSColor, NSTimer,
         NSMakeRect, NSBackingStoreBuffered, NSFloatingWindowLevel,
-        NSCompositingOperationSourceOver, NSScreen,
+        NSScreen,
         NSAnimationContext, NSBezierPath,
         NSMutableParagraphStyle, NSParagraphStyleAttributeName,
-        NSMakePoint, NSAffineTransform,
+        NSMakePoint,
     )
     from Foundation import (
-        NSData, NSObject, NSAttributedString, NSMutableDictionary,
+        NSData, NSObject, NSAttributedString, NSMutableDictionary, NSNull,
+        NSNotificationCenter, NSProcessInfo,
     )
     # NSApplicationActivationPolicy constant (not always exported by PyObjC)
     NSApplicationActivationPolicyProhibited = 2
@@ -45,7 +59,35 @@ try:
         kCGWindowListOptionOnScreenOnly,
         kCGWindowListExcludeDesktopElements,
         kCGNullWindowID,
+        kCGWindowIsOnscreen,
+        kCGWindowListOptionIncludingWindow,
         CGColorCreateGenericRGB,
+        CABasicAnimation,
+        CALayer,
+        CAMediaTimingFunction,
+        CAShapeLayer,
+        CATextLayer,
+        kCAMediaTimingFunctionEaseInEaseOut,
+        CGAffineTransformMakeRotation,
+        CGAffineTransformMakeScale,
+        CGAffineTransformMakeTranslation,
+        CGAffineTransformRotate,
+        CGAffineTransformScale,
+        CGColorSpaceCreateWithName,
+        CGDataProviderCreateWithCFData,
+        CGImageCreate,
+        CGPathAddLineToPoint,
+        CGPathCloseSubpath,
+        CGPathCreateMutable,
+        CGPathMoveToPoint,
+        CVDisplayLinkCreateWithActiveCGDisplays,
+        CVDisplayLinkSetOutputCallback,
+        CVDisplayLinkStart,
+        CVDisplayLinkStop,
+        kCVReturnSuccess,
+        kCGColorSpaceSRGB,
+        kCGImageAlphaLast,
+        kCGRenderingIntentDefault,
     )
 except ImportError:
     print("Required: pip3 install pyobjc-framework-Cocoa")
@@ -93,6 +135,8 @@ STATE_DURATIONS = {
 # Animation constants - floating effect
 FLOAT_AMPLITUDE = 3.0   # pixels of vertical movement
 FLOAT_PERIOD = 2.5      # seconds for full oscillation cycle
+FLOAT_FREQ = 1.0 / FLOAT_PERIOD  # cycles per second
+FLOAT_MIN_STEP = 0.5    # pixels; smaller moves don't touch the window frame
 
 # Animation constants - aura glow effect
 AURA_COLOR = (0.4, 0.55, 1.0, 1.0)  # Soft blue (R, G, B, A)
@@ -104,16 +148,25 @@ AURA_OPACITY = 0.5
 # Animation constants - breathing effect (scale pulse)
 BREATH_INTENSITY = 0.008    # 0.8% scale change
 BREATH_PERIOD = 3.5         # seconds for full breath cycle
+BREATH_FREQ = 1.0 / BREATH_PERIOD
 
 # Animation constants - sway effect (gentle rotation + drift)
 SWAY_ANGLE = 1.5            # degrees max rotation
 SWAY_PERIOD = 4.0           # seconds for full sway cycle
+SWAY_FREQ = 1.0 / SWAY_PERIOD
 SWAY_X = 2.0                # pixels horizontal drift
 
 # Animation constants - cursor influence
 CURSOR_TILT_MAX = 3.0       # degrees max tilt toward cursor
 CURSOR_SHIFT_MAX = 5.0      # pixels max shift toward cursor
 CURSOR_FALLOFF = 300.0      # distance for effect falloff
+CURSOR_TILT_PER_PX = CURSOR_TILT_MAX / 500.0  # at full strength
+CURSOR_SHIFT_PER_PX = CURSOR_SHIFT_MAX / 500.0
+CURSOR_POLL_INTERVAL = 1.0 / 30  # Cursor sampled at half the frame rate
+
+# Image transform changes below these are invisible and skipped
+TRANSFORM_EPSILON = 0.01    # pixels / degrees
+SCALE_EPSILON = 1e-4
 
 # State transition animation types
 TRANSITION_BOUNCE = 'bounce'
@@ -154,19 +207,63 @@ EMOTION_OVERLAYS = {
     'working': ['focus_lines'],
 }
 
+# Sleeping "Zzz" letters: (font size, x offset, y offset) from base point
+ZZZ_LETTERS = ((14, 0, 0), (11, 15, 20), (8, 25, 35))
+
+# Sparkle stars as fractions of the view size; star path size in points
+SPARKLE_POSITIONS = ((0.15, 0.8), (0.85, 0.85), (0.9, 0.6), (0.1, 0.5))
+STAR_PATH_RADIUS = 10.0
+
+# Emotions rendered by sublayers rather than drawRect_
+LAYER_EMOTIONS = frozenset(('zzz', 'sparkle', 'star'))
+
 # Supported audio formats (NSSound)
 AUDIO_EXTENSIONS = ('.wav', '.mp3', '.m4a', '.aiff', '.aif', '.caf', '.aac')
 
+# Resampling filters for per-size state image resizes, by setting name.
+# Lanczos is kept for the one-time source scaling.
+RESAMPLE_FILTERS = {
+    'nearest': Image.Resampling.NEAREST,
+    'bilinear': Image.Resampling.BILINEAR,
+    'bicubic': Image.Resampling.BICUBIC,
+    'lanczos': Image.Resampling.LANCZOS,
+}
+DEFAULT_RESIZE_FILTER = 'bicubic'
+
 # Performance: Window position cache TTL (seconds)
 WINDOW_POSITION_CACHE_TTL = 0.5  # Only query Quartz every 500ms
+TERMINAL_POSITION_CACHE_TTL = 2.0  # Active terminal lookup (startup/reload)
+FRONTMOST_CACHE_TTL = 0.25  # Polled focus checks reuse a recent answer
+WINDOW_STATE_CACHE_TTL = 0.3  # Per-window exists / on-screen answers
+IMAGE_CACHE_SIZE = 32  # State NSImages kept (LRU by path/size/gradient)
+
+# Terminal apps recognised when locating the active terminal window
+TERMINAL_APPS = ('Terminal', 'iTerm', 'Alacritty', 'kitty', 'Warp')
+TERMINAL_OWNER_RE = re.compile('|'.join(map(re.escape, TERMINAL_APPS)))
 
 # Socket/timing constants
 ANIMATION_FPS = 60
 ANIMATION_FRAME_TIME = 1.0 / ANIMATION_FPS  # ~0.016s
-SOCKET_TIMEOUT = 0.1
+MIN_FRAME_INTERVAL = ANIMATION_FRAME_TIME * 0.75  # Coalesce early ticks
+LOW_POWER_FRAME_INTERVAL = MIN_FRAME_INTERVAL * 2  # ~30fps in Low Power Mode
+ANIMATION_TIMER_TOLERANCE = 0.002  # Leeway for the fallback frame timer
+TIMER_TOLERANCE_RATIO = 0.25  # Slack on non-critical timers, per interval
+MAX_TIMER_TOLERANCE = 0.5
+WINDOW_SNAPSHOT_TTL = ANIMATION_FRAME_TIME  # One window list per frame
+CLIENT_TIMEOUT = 1.0  # Max wait on a connected client before dropping it
+MAX_MESSAGE_SIZE = 65536  # Upper bound for a single IPC message
+PING_MESSAGE = b'{"cmd": "PING"}'  # Exact health check the hooks send
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
 PARENT_CHECK_INTERVAL = 2.0
-VISIBILITY_CHECK_INTERVAL = 0.5
+# Backstop only; focus/hide/Space changes are observed as events. Trade-off:
+# minimizing or un-minimizing the terminal posts no notification we can
+# see, so the overlay reacts to it up to this long (+ timer tolerance) late.
+# Startup rechecks once at grace end and once terminal info arrives.
+VISIBILITY_CHECK_INTERVAL = 2.0
 STARTUP_GRACE_PERIOD = 1.5
+RESIZE_SETTLE = 0.2  # Terminal height must hold this long before resize
+VISIBILITY_DEBOUNCE = 0.05  # Focus events settle before show/hide
+SPACE_SETTLE_DELAY = 0.1  # Let a Space switch finish before checking
 CROSSFADE_DURATION = 0.2
 FADE_DURATION = 0.3
 
@@ -186,12 +283,57 @@ DEFAULT_MESSAGES = {
 }
 
 
+def split_messages(pending: bytearray) -> list:
+    """Pop every complete newline-framed message off the front of a buffer."""
+    end = pending.rfind(b'\n')
+    if end < 0:
+        return []
+    messages = [bytes(m) for m in pending[:end].split(b'\n') if m.strip()]
+    del pending[:end + 1]
+    return messages
+
+
+def read_png_size(path) -> Optional[tuple]:
+    """Read (width, height) from a PNG's IHDR header without decoding."""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if len(header) < 24 or header[:8] != PNG_SIGNATURE \
+            or header[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+def decode_message(raw: bytes):
+    """Parse one framed socket message."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode_reply(result) -> bytes:
+    """Serialize a socket reply as one newline-framed JSON line."""
+    if orjson is not None:
+        return orjson.dumps(result) + b'\n'
+    return f'{json.dumps(result)}\n'.encode('utf-8')
+
+
+def read_json(path: Path):
+    """Parse a JSON file from its raw bytes (orjson when installed)."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_settings() -> dict:
     """Load settings from settings-fx.json."""
     settings_file = PLUGIN_ROOT / 'settings-fx.json'
     if settings_file.exists():
         try:
-            return json.loads(settings_file.read_text())
+            return read_json(settings_file)
         except Exception:
             pass
     return {}
@@ -207,11 +349,27 @@ def save_settings(settings: dict) -> bool:
         return False
 
 
+@lru_cache(maxsize=8)
+def gradient_ramp(width: int, gradient_height: int) -> Image.Image:
+    """Alpha ramp from opaque to transparent over a width x height band.
+
+    State images share a size within a session, so the ramp is built
+    once per size rather than on every image load. Callers must not
+    modify the returned image.
+    """
+    ramp = Image.new('L', (1, gradient_height))
+    ramp.putdata([
+        int(255 * (1.0 - y / gradient_height))
+        for y in range(gradient_height)
+    ])
+    return ramp.resize((width, gradient_height), Image.Resampling.NEAREST)
+
+
 def apply_bottom_gradient(pil_image: Image.Image, percentage: float):
     """Apply alpha gradient to bottom portion of image.
 
     Args:
-        pil_image: PIL Image (will be converted to RGBA if needed)
+        pil_image: PIL Image (RGBA from the loader; others are converted)
         percentage: Fraction of image height to fade (0.0-1.0)
 
     Returns:
@@ -229,26 +387,35 @@ def apply_bottom_gradient(pil_image: Image.Image, percentage: float):
     if gradient_height <= 0:
         return pil_image
 
-    pixels = pil_image.load()
     start_y = height - gradient_height
 
-    for y in range(start_y, height):
-        progress = (y - start_y) / gradient_height
-        alpha_mult = 1.0 - progress
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            pixels[x, y] = (r, g, b, int(a * alpha_mult))
+    # Multiply alpha in C rather than per pixel in Python
+    alpha = pil_image.getchannel('A')
+    band = alpha.crop((0, start_y, width, height))
+    alpha.paste(
+        ImageChops.multiply(band, gradient_ramp(width, gradient_height)),
+        (0, start_y)
+    )
+    pil_image.putalpha(alpha)
 
     return pil_image
 
 
 def pil_to_nsimage(pil_image: Image.Image) -> NSImage:
-    """Convert PIL Image to NSImage."""
-    buffer = io.BytesIO()
-    pil_image.save(buffer, format='PNG')
-    png_data = buffer.getvalue()
-    data = NSData.dataWithBytes_length_(png_data, len(png_data))
-    return NSImage.alloc().initWithData_(data)
+    """Convert PIL Image to NSImage from raw RGBA (no PNG round-trip)."""
+    if pil_image.mode != 'RGBA':
+        pil_image = pil_image.convert('RGBA')
+    width, height = pil_image.size
+    raw = pil_image.tobytes()
+    provider = CGDataProviderCreateWithCFData(
+        NSData.dataWithBytes_length_(raw, len(raw))
+    )
+    cg_image = CGImageCreate(
+        width, height, 8, 32, width * 4,
+        CGColorSpaceCreateWithName(kCGColorSpaceSRGB),
+        kCGImageAlphaLast, provider, None, False, kCGRenderingIntentDefault
+    )
+    return NSImage.alloc().initWithCGImage_size_(cg_image, (width, height))
 
 
 def load_messages(plugin_root: Path) -> dict:
@@ -256,7 +423,7 @@ def load_messages(plugin_root: Path) -> dict:
     messages_file = plugin_root / 'messages.json'
     if messages_file.exists():
         try:
-            return json.loads(messages_file.read_text())
+            return read_json(messages_file)
         except Exception:
             pass
     return DEFAULT_MESSAGES
@@ -290,47 +457,32 @@ def find_sound_file(
     return None
 
 
+def _hex_rgb(hex_color: str) -> Optional[tuple]:
+    """Parse 'RRGGBB' (optionally '#'-prefixed) into 0.0-1.0 floats."""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        return None
+    r, g, b = bytes.fromhex(hex_color)
+    return (r / 255.0, g / 255.0, b / 255.0)
+
+
+@lru_cache(maxsize=32)
 def hex_to_nscolor(hex_color: str) -> NSColor:
     """Convert hex color string to NSColor."""
-    hex_color = hex_color.lstrip('#')
-    if len(hex_color) == 6:
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-        return NSColor.colorWithRed_green_blue_alpha_(r, g, b, 1.0)
+    rgb = _hex_rgb(hex_color)
+    if rgb:
+        return NSColor.colorWithRed_green_blue_alpha_(*rgb, 1.0)
     return NSColor.whiteColor()
 
 
 def hex_to_rgba(hex_color: str, alpha: float = 1.0) -> tuple:
     """Convert hex color string to RGBA tuple (0.0-1.0 range)."""
-    hex_color = hex_color.lstrip('#')
-    if len(hex_color) == 6:
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-        return (r, g, b, alpha)
+    rgb = _hex_rgb(hex_color)
+    if rgb:
+        return (*rgb, alpha)
     return (1.0, 1.0, 1.0, alpha)
 
 
-def generate_shadow_image(pil_image: Image.Image, blur: int = 20,
-                          opacity: float = 0.3) -> Image.Image:
-    """Generate a shadow from a PIL image."""
-    if pil_image.mode != 'RGBA':
-        pil_image = pil_image.convert('RGBA')
-
-    # Extract alpha channel and create shadow
-    alpha = pil_image.split()[3]
-    shadow = Image.new('RGBA', pil_image.size, (0, 0, 0, 0))
-
-    # Create shadow from alpha
-    shadow_alpha = alpha.point(lambda x: int(x * opacity))
-    shadow_blurred = shadow_alpha.filter(ImageFilter.GaussianBlur(blur))
-
-    # Composite shadow
-    shadow.putalpha(shadow_blurred)
-    return shadow
-
-
 def ease_out_bounce(t: float) -> float:
     """Easing function for bounce effect."""
     if t < 1 / 2.75:
@@ -355,6 +507,66 @@ def ease_out_elastic(t: float) -> float:
     return pow(2, -10 * t) * math.sin((t - s) * (2 * math.pi) / p) + 1
 
 
+# Sine lookup table for periodic animation phases (power of two size)
+SIN_TABLE_SIZE = 1024
+_SIN_TABLE = [
+    math.sin(2 * math.pi * i / SIN_TABLE_SIZE) for i in range(SIN_TABLE_SIZE)
+]
+
+
+def fast_sin(turns: float) -> float:
+    """Table sine of a phase in turns (1.0 = one full cycle)."""
+    return _SIN_TABLE[int(turns * SIN_TABLE_SIZE) & (SIN_TABLE_SIZE - 1)]
+
+
+def fast_cos(turns: float) -> float:
+    """Table cosine of a phase in turns (1.0 = one full cycle)."""
+    return fast_sin(turns + 0.25)
+
+
+# Star outline shared by every sparkle/star layer (built on first use)
+_star_path = None
+
+
+def get_star_path():
+    """Return the shared 4-pointed star CGPath centred on the origin."""
+    global _star_path
+    if _star_path is None:
+        r = STAR_PATH_RADIUS
+        path = CGPathCreateMutable()
+        CGPathMoveToPoint(path, None, 0, r)
+        for x, y in ((0.3, 0.3), (1, 0), (0.3, -0.3), (0, -1),
+                     (-0.3, -0.3), (-1, 0), (-0.3, 0.3)):
+            CGPathAddLineToPoint(path, None, x * r, y * r)
+        CGPathCloseSubpath(path)
+        _star_path = path
+    return _star_path
+
+
+# Bound once instead of resolving the long selector name per timer
+schedule_timer = (
+    NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_
+)
+
+
+def relax_timer(timer, interval: float):
+    """Let the OS coalesce a non-critical timer's wakeups with others."""
+    timer.setTolerance_(
+        min(interval * TIMER_TOLERANCE_RATIO, MAX_TIMER_TOLERANCE)
+    )
+    return timer
+
+
+def notification_app_pid(notification) -> Optional[int]:
+    """PID of the app an NSWorkspace notification is about."""
+    info = notification.userInfo() if notification is not None else None
+    if info is None:
+        return None
+    # objectForKey_ yields None for a missing key; nothing here raises
+    app = info.objectForKey_(NSWorkspaceApplicationKey)
+    return app.processIdentifier() if app is not None else None
+
+
 def get_cursor_position() -> tuple:
     """Get current mouse cursor position."""
     try:
@@ -364,16 +576,44 @@ def get_cursor_position() -> tuple:
         return (0, 0)
 
 
-def get_terminal_position():
-    """Get active terminal window position."""
+# On-screen, non-desktop windows: the mask every list lookup shares
+ONSCREEN_WINDOW_OPTS = (kCGWindowListOptionOnScreenOnly |
+                        kCGWindowListExcludeDesktopElements)
+
+# Shared on-screen window list (module-level, refreshed once per frame)
+_window_snapshot: Optional[list] = None
+_window_snapshot_time: float = 0.0
+
+
+def get_window_snapshot() -> Optional[list]:
+    """On-screen window list shared by all lookups within one frame."""
+    global _window_snapshot, _window_snapshot_time
+
+    now = time.perf_counter()
+    if (_window_snapshot is not None
+            and (now - _window_snapshot_time) < WINDOW_SNAPSHOT_TTL):
+        return _window_snapshot
+
     try:
-        terminals = ['Terminal', 'iTerm', 'Alacritty', 'kitty', 'Warp']
-        windows = CGWindowListCopyWindowInfo(
-            kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+        _window_snapshot = CGWindowListCopyWindowInfo(
+            ONSCREEN_WINDOW_OPTS, kCGNullWindowID
         )
+    except Exception:
+        _window_snapshot = None
+    _window_snapshot_time = now
+    return _window_snapshot
+
+
+def get_terminal_position(windows: Optional[list] = None):
+    """Get active terminal window position."""
+    try:
+        if windows is None:
+            windows = CGWindowListCopyWindowInfo(
+                kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+            )
+        match_owner = TERMINAL_OWNER_RE.search
         for w in windows:
-            owner = w.get('kCGWindowOwnerName', '')
-            if any(t in owner for t in terminals):
+            if match_owner(w.get('kCGWindowOwnerName', '')):
                 b = w.get('kCGWindowBounds', {})
                 return {
                     'x': int(b.get('X', 100)),
@@ -386,7 +626,28 @@ def get_terminal_position():
     return {'x': 100, 'y': 100, 'w': 800, 'h': 600}
 
 
-def is_our_window_frontmost(terminal_pid: int, window_id: int) -> bool:
+# Active terminal position cache (module-level for performance)
+_terminal_pos_cache: Optional[dict] = None
+_terminal_pos_cache_time: float = 0.0
+
+
+def get_terminal_position_cached() -> dict:
+    """Get active terminal window position with caching."""
+    global _terminal_pos_cache, _terminal_pos_cache_time
+
+    now = time.perf_counter()
+    if (_terminal_pos_cache is not None and
+            (now - _terminal_pos_cache_time) < TERMINAL_POSITION_CACHE_TTL):
+        return _terminal_pos_cache
+
+    # Cache miss - query Quartz
+    _terminal_pos_cache = get_terminal_position(get_window_snapshot())
+    _terminal_pos_cache_time = now
+    return _terminal_pos_cache
+
+
+def is_our_window_frontmost(terminal_pid: int, window_id: int,
+                            windows: Optional[list] = None) -> bool:
     """
     Check if our terminal window is frontmost.
 
@@ -411,9 +672,10 @@ def is_our_window_frontmost(terminal_pid: int, window_id: int) -> bool:
             return True
 
         # window_id known: check if OUR window is frontmost among terminals
-        opts = (kCGWindowListOptionOnScreenOnly |
-                kCGWindowListExcludeDesktopElements)
-        windows = CGWindowListCopyWindowInfo(opts, kCGNullWindowID)
+        if windows is None:
+            windows = CGWindowListCopyWindowInfo(
+                ONSCREEN_WINDOW_OPTS, kCGNullWindowID
+            )
         if not windows:
             return True  # Can't verify = show (permissive)
 
@@ -432,14 +694,77 @@ def is_our_window_frontmost(terminal_pid: int, window_id: int) -> bool:
         return True  # Error = show (permissive when terminal active)
 
 
-def get_terminal_window_position(window_id: int) -> Optional[dict]:
+# Frontmost check cache: (terminal_pid, window_id) -> result
+_frontmost_cache: dict = {}
+_frontmost_cache_time: float = 0.0
+
+
+def is_our_window_frontmost_cached(terminal_pid: int, window_id: int) -> bool:
+    """Frontmost check for polling paths (avoids a window list per tick)."""
+    global _frontmost_cache, _frontmost_cache_time
+
+    key = (terminal_pid, window_id)
+    now = time.perf_counter()
+    if (now - _frontmost_cache_time) < FRONTMOST_CACHE_TTL:
+        if key in _frontmost_cache:
+            return _frontmost_cache[key]
+    else:
+        _frontmost_cache = {}
+
+    result = is_our_window_frontmost(
+        terminal_pid, window_id, get_window_snapshot()
+    )
+    if not _frontmost_cache:
+        _frontmost_cache_time = now
+    _frontmost_cache[key] = result
+    return result
+
+
+# Per-window state: window_id -> (time, None | on-screen bool)
+_window_state_cache: dict = {}
+
+
+def invalidate_frontmost_cache():
+    """Drop cached frontmost and window-ID answers (focus/Space changed)."""
+    global _frontmost_cache
+    _frontmost_cache = {}
+    _window_state_cache.clear()
+
+
+def get_window_state(window_id: int) -> Optional[bool]:
+    """Whether a window is on screen; None if it no longer exists.
+
+    Asks WindowServer about this one window only, so the cost doesn't
+    grow with the number of windows open. Answers are kept briefly.
+    """
+    now = time.perf_counter()
+    cached = _window_state_cache.get(window_id)
+    if cached is not None and (now - cached[0]) < WINDOW_STATE_CACHE_TTL:
+        return cached[1]
+
+    try:
+        windows = CGWindowListCopyWindowInfo(
+            kCGWindowListOptionIncludingWindow, window_id
+        )
+    except Exception:
+        return None  # Not cached; the next call retries
+    # kCGWindowIsOnscreen is omitted for off-screen windows
+    state = bool(windows[0].get(kCGWindowIsOnscreen)) if windows else None
+    _window_state_cache[window_id] = (now, state)
+    return state
+
+
+def get_terminal_window_position(window_id: int,
+                                 windows: Optional[list] = None
+                                 ) -> Optional[dict]:
     """Get position of specific terminal window by ID."""
     if not window_id:
         return None
     try:
-        windows = CGWindowListCopyWindowInfo(
-            kCGWindowListOptionOnScreenOnly, kCGNullWindowID
-        )
+        if windows is None:
+            windows = CGWindowListCopyWindowInfo(
+                kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+            )
         for w in windows:
             if w.get('kCGWindowNumber') == window_id:
                 b = w.get('kCGWindowBounds', {})
@@ -471,14 +796,112 @@ def get_terminal_window_position_cached(window_id: int) -> Optional[dict]:
         return _window_pos_cache.get(window_id)
 
     # Cache miss - query Quartz
-    pos = get_terminal_window_position(window_id)
+    pos = get_terminal_window_position(window_id, get_window_snapshot())
     _window_pos_cache[window_id] = pos
     _window_pos_cache_time = now
     return pos
 
 
+class OverlayConfig:
+    """Settings resolved once from settings-fx.json."""
+
+    __slots__ = (
+        'max_height', 'offset_x', 'offset_y', 'custom_x', 'custom_y',
+        'responsive', 'height_ratio', 'resize_filter',
+        'show_only_when_active', 'fade_animation',
+        'gradient_enabled', 'gradient_percentage', 'use_gradient',
+        'breathing', 'sway', 'cursor_influence', 'cursor_influence_strength',
+        'transitions', 'speech', 'speech_enabled', 'speech_duration',
+        'emotions', 'aura_enabled', 'aura_color', 'aura_opacity',
+        'aura_min_radius', 'aura_max_radius', 'aura_period',
+        'audio_enabled', 'audio_volume', 'theme', 'character_folder',
+    )
+
+    @classmethod
+    def from_settings(cls, settings: dict) -> 'OverlayConfig':
+        """Build a config, filling in defaults for missing keys."""
+        cfg = cls()
+        overlay_cfg = settings.get('overlay') or {}
+        cfg.max_height = overlay_cfg.get('maxHeight', DEFAULT_MAX_HEIGHT)
+        cfg.offset_x = overlay_cfg.get('offsetX', DEFAULT_OFFSET_X)
+        cfg.offset_y = overlay_cfg.get('offsetY', DEFAULT_OFFSET_Y)
+        cfg.custom_x = overlay_cfg.get('customX')
+        cfg.custom_y = overlay_cfg.get('customY')
+        cfg.responsive = overlay_cfg.get('responsive', True)
+        cfg.height_ratio = overlay_cfg.get('heightRatio', DEFAULT_HEIGHT_RATIO)
+        cfg.resize_filter = RESAMPLE_FILTERS.get(
+            overlay_cfg.get('resizeFilter', DEFAULT_RESIZE_FILTER),
+            RESAMPLE_FILTERS[DEFAULT_RESIZE_FILTER]
+        )
+        cfg.show_only_when_active = overlay_cfg.get(
+            'showOnlyWhenTerminalActive', True
+        )
+        cfg.fade_animation = overlay_cfg.get('fadeAnimation', True)
+
+        # Bottom gradient
+        gradient_cfg = overlay_cfg.get('bottomGradient') or {}
+        cfg.gradient_enabled = gradient_cfg.get('enabled', True)
+        cfg.gradient_percentage = gradient_cfg.get('percentage', 0.8)
+        # Otherwise state images skip Pillow and load straight into NSImage
+        cfg.use_gradient = (
+            cfg.gradient_enabled and cfg.gradient_percentage > 0
+        )
+
+        # Immersion
+        immersion_cfg = settings.get('immersion') or {}
+        cfg.breathing = immersion_cfg.get('breathing', True)
+        cfg.sway = immersion_cfg.get('sway', True)
+        cfg.cursor_influence = immersion_cfg.get('cursorInfluence', True)
+        cfg.cursor_influence_strength = immersion_cfg.get(
+            'cursorInfluenceStrength', 0.5
+        )
+        cfg.transitions = immersion_cfg.get('transitions', True)
+
+        # Speech bubble (raw section is passed on to the bubble view)
+        cfg.speech = settings.get('speechBubble') or {}
+        cfg.speech_enabled = cfg.speech.get('enabled', True)
+        cfg.speech_duration = cfg.speech.get('displayDuration', 3.0)
+
+        # Emotion overlays
+        cfg.emotions = (settings.get('emotionOverlays') or {}).get(
+            'enabled', True
+        )
+
+        # Aura
+        aura_cfg = settings.get('aura') or {}
+        cfg.aura_enabled = aura_cfg.get('enabled', True)
+        cfg.aura_color = hex_to_rgba(aura_cfg.get('color', '#6699ff'))
+        cfg.aura_opacity = aura_cfg.get('opacity', AURA_OPACITY)
+        cfg.aura_min_radius = aura_cfg.get('minRadius', AURA_MIN_RADIUS)
+        cfg.aura_max_radius = aura_cfg.get('maxRadius', AURA_MAX_RADIUS)
+        cfg.aura_period = aura_cfg.get('period', AURA_PERIOD)
+
+        # Audio
+        audio_cfg = settings.get('audio') or {}
+        cfg.audio_enabled = audio_cfg.get('enabled', True)
+        cfg.audio_volume = audio_cfg.get('volume', 0.5)
+
+        cfg.theme = settings.get('theme', 'default')
+        cfg.character_folder = settings.get('characterFolder', 'characters')
+        return cfg
+
+
+class StateAssets:
+    """Per-state lookups resolved once and reused on every state change."""
+
+    __slots__ = ('img_path', 'size', 'messages', 'emotions', 'transition')
+
+    def __init__(self, img_path: Optional[Path], size: Optional[tuple],
+                 messages: list, emotions: list, transition: dict):
+        self.img_path = img_path  # Resolved image file, None if missing
+        self.size = size  # Native (width, height) of the image
+        self.messages = messages
+        self.emotions = emotions
+        self.transition = transition
+
+
 class ImageView(NSView):
-    """Custom view that draws an image with transparency and transforms."""
+    """Layer-backed view that shows an image with GPU-applied transforms."""
 
     def initWithFrame_(self, frame):
         self = objc.super(ImageView, self).initWithFrame_(frame)
@@ -490,46 +913,61 @@ class ImageView(NSView):
         self.scale_y = 1.0
         self.offset_x = 0.0
         self.offset_y = 0.0
+
+        # AppKit owns the backing layer's geometry, so the image and its
+        # transform live on a sublayer we control (centered anchor point)
+        self.setWantsLayer_(True)
+        self.image_layer = CALayer.layer()
+        no_anim = NSNull.null()
+        self.image_layer.setActions_({
+            'contents': no_anim, 'transform': no_anim,
+            'bounds': no_anim, 'position': no_anim,
+        })
+        self.layer().addSublayer_(self.image_layer)
+        self.layoutImageLayer()
         return self
 
+    def setFrame_(self, frame):
+        objc.super(ImageView, self).setFrame_(frame)
+        self.layoutImageLayer()
+
+    def viewDidChangeBackingProperties(self):
+        window = self.window()
+        if window:
+            self.image_layer.setContentsScale_(window.backingScaleFactor())
+
     def setImage_(self, image):
         self.image = image
-        self.setNeedsDisplay_(True)
+        self.image_layer.setContents_(image)
+
+    @objc.python_method
+    def layoutImageLayer(self):
+        """Size the image layer to the view, anchored at its center."""
+        size = self.bounds().size
+        self.image_layer.setBounds_(((0, 0), (size.width, size.height)))
+        self.image_layer.setPosition_((size.width / 2, size.height / 2))
 
     @objc.python_method
     def updateTransform(self, rotation, scale_x, scale_y, offset_x, offset_y):
         """Set transform parameters for breathing/sway effects."""
+        # Skip the layer update when nothing visibly moved
+        if (abs(rotation - self.rotation) < TRANSFORM_EPSILON
+                and abs(offset_x - self.offset_x) < TRANSFORM_EPSILON
+                and abs(offset_y - self.offset_y) < TRANSFORM_EPSILON
+                and abs(scale_x - self.scale_x) < SCALE_EPSILON
+                and abs(scale_y - self.scale_y) < SCALE_EPSILON):
+            return
         self.rotation = rotation
         self.scale_x = scale_x
         self.scale_y = scale_y
         self.offset_x = offset_x
         self.offset_y = offset_y
-        self.setNeedsDisplay_(True)
 
-    def drawRect_(self, rect):
-        if self.image:
-            bounds = self.bounds()
-            center_x = bounds.size.width / 2
-            center_y = bounds.size.height / 2
-
-            # Apply transforms
-            transform = NSAffineTransform.transform()
-            transform.translateXBy_yBy_(
-                center_x + self.offset_x,
-                center_y + self.offset_y
-            )
-            transform.rotateByDegrees_(self.rotation)
-            transform.scaleXBy_yBy_(self.scale_x, self.scale_y)
-            transform.translateXBy_yBy_(-center_x, -center_y)
-            transform.concat()
-
-            # Draw image
-            self.image.drawInRect_fromRect_operation_fraction_(
-                bounds,
-                NSMakeRect(0, 0, 0, 0),
-                NSCompositingOperationSourceOver,
-                1.0
-            )
+        # Offset, then rotate and scale around the layer's center
+        transform = CGAffineTransformMakeTranslation(offset_x, offset_y)
+        transform = CGAffineTransformRotate(transform, math.radians(rotation))
+        transform = CGAffineTransformScale(transform, scale_x, scale_y)
+        self.image_layer.setAffineTransform_(transform)
 
 
 class SpeechBubbleView(NSView):
@@ -553,6 +991,14 @@ class SpeechBubbleView(NSView):
         self.border_radius = 8.0
         self.padding = 10.0
         self.tail_size = 8.0
+        # Text attributes and string are rebuilt only when style/text change
+        self.text_attrs = None
+        self.attr_str = None
+        # Cached layer bitmap; drawRect_ only runs when text/style changes
+        self.setWantsLayer_(True)
+        self.setLayerContentsRedrawPolicy_(
+            NSViewLayerContentsRedrawOnSetNeedsDisplay
+        )
         return self
 
     def configure_(self, config: dict):
@@ -575,13 +1021,43 @@ class SpeechBubbleView(NSView):
             self.border_radius = float(config['borderRadius'])
         if 'padding' in config:
             self.padding = float(config['padding'])
+        self.text_attrs = None
+        self.attr_str = None
         self.setNeedsDisplay_(True)
 
     def setText_(self, text: str):
         """Set the bubble text."""
+        if text == self.text:
+            return
         self.text = text
+        self.attr_str = None
         self.setNeedsDisplay_(True)
 
+    @objc.python_method
+    def _attributed_text(self):
+        """Return the styled bubble text, building it on first use."""
+        if self.attr_str is None:
+            if self.text_attrs is None:
+                font = NSFont.fontWithName_size_(
+                    self.font_name, self.font_size
+                )
+                if not font:
+                    font = NSFont.systemFontOfSize_(self.font_size)
+
+                attrs = NSMutableDictionary.dictionary()
+                attrs[NSFontAttributeName] = font
+                attrs[NSForegroundColorAttributeName] = self.font_color
+
+                # Center text
+                para = NSMutableParagraphStyle.alloc().init()
+                para.setAlignment_(1)  # NSCenterTextAlignment
+                attrs[NSParagraphStyleAttributeName] = para
+                self.text_attrs = attrs
+
+            self.attr_str = NSAttributedString.alloc() \
+                .initWithString_attributes_(self.text, self.text_attrs)
+        return self.attr_str
+
     def drawRect_(self, rect):
         if not self.text:
             return
@@ -621,22 +1097,7 @@ class SpeechBubbleView(NSView):
         path.stroke()
 
         # Draw text
-        font = NSFont.fontWithName_size_(self.font_name, self.font_size)
-        if not font:
-            font = NSFont.systemFontOfSize_(self.font_size)
-
-        attrs = NSMutableDictionary.dictionary()
-        attrs[NSFontAttributeName] = font
-        attrs[NSForegroundColorAttributeName] = self.font_color
-
-        # Center text
-        para = NSMutableParagraphStyle.alloc().init()
-        para.setAlignment_(1)  # NSCenterTextAlignment
-        attrs[NSParagraphStyleAttributeName] = para
-
-        attr_str = NSAttributedString.alloc().initWithString_attributes_(
-            self.text, attrs
-        )
+        attr_str = self._attributed_text()
         text_size = attr_str.size()
         text_x = (bounds.size.width - text_size.width) / 2
         text_y = tail + padding + (
@@ -654,20 +1115,139 @@ class EmotionOverlayView(NSView):
             return None
         self.emotions = []  # List of emotion types to display
         self.animation_phase = 0.0
+        self.zzz_layers = None  # Text layers, built on first 'zzz'
+        self.star_layers = None  # Sparkles then star, built on first use
+        self.draws_shapes = False  # Any emotion drawn in drawRect_
+        self.setWantsLayer_(True)
+        self.setLayerContentsRedrawPolicy_(
+            NSViewLayerContentsRedrawOnSetNeedsDisplay
+        )
         return self
 
     def setEmotions_(self, emotions: list):
         """Set which emotions to display."""
-        self.emotions = emotions or []
+        emotions = emotions or []
+        if emotions == self.emotions:
+            return
+        self.emotions = emotions
+        # Zzz and stars live in sublayers; the rest is drawn per phase
+        self.draws_shapes = any(e not in LAYER_EMOTIONS for e in emotions)
+        show_zzz = 'zzz' in emotions
+        if show_zzz and self.zzz_layers is None:
+            self._build_zzz_layers()
+        if self.zzz_layers is not None:
+            for layer in self.zzz_layers:
+                layer.setHidden_(not show_zzz)
+            self._layout_zzz_layers()
+        show_sparkle = 'sparkle' in emotions
+        show_star = 'star' in emotions
+        if (show_sparkle or show_star) and self.star_layers is None:
+            self._build_star_layers()
+        if self.star_layers is not None:
+            for layer in self.star_layers[:-1]:
+                layer.setHidden_(not show_sparkle)
+            self.star_layers[-1].setHidden_(not show_star)
+            self._layout_star_layers()
         self.setNeedsDisplay_(True)
 
     def setAnimationPhase_(self, phase: float):
         """Update animation phase for animated emotions."""
         self.animation_phase = phase
-        self.setNeedsDisplay_(True)
+        self._layout_zzz_layers()
+        self._layout_star_layers()
+        if self.draws_shapes:
+            self.setNeedsDisplay_(True)
+
+    @objc.python_method
+    def _build_zzz_layers(self):
+        """Create the Zzz text layers once (no per-frame text layout)."""
+        window = self.window()
+        scale = window.backingScaleFactor() if window else 1.0
+        no_anim = NSNull.null()
+        self.zzz_layers = []
+        for i, (size, _, _) in enumerate(ZZZ_LETTERS):
+            layer = CATextLayer.layer()
+            layer.setString_("Z")
+            layer.setFont_(NSFont.boldSystemFontOfSize_(size))
+            layer.setFontSize_(size)
+            layer.setForegroundColor_(
+                CGColorCreateGenericRGB(0.7, 0.7, 0.9, 0.8 - i * 0.2)
+            )
+            layer.setContentsScale_(scale)
+            # Origin at bottom-left, like drawAtPoint
+            layer.setAnchorPoint_((0, 0))
+            layer.setBounds_(((0, 0), (size, size * 1.3)))
+            layer.setActions_({'position': no_anim, 'hidden': no_anim})
+            self.layer().addSublayer_(layer)
+            self.zzz_layers.append(layer)
+
+    @objc.python_method
+    def _layout_zzz_layers(self):
+        """Move the Zzz layers for the current phase (floating up)."""
+        if self.zzz_layers is None or 'zzz' not in self.emotions:
+            return
+        size = self.bounds().size
+        base_x = size.width * 0.8
+        base_y = size.height * 0.7
+        # sin(2 * phase), with the phase expressed in turns
+        float_offset = fast_sin(self.animation_phase / math.pi) * 5
+        for i, (_, ox, oy) in enumerate(ZZZ_LETTERS):
+            self.zzz_layers[i].setPosition_((
+                base_x + ox,
+                base_y + oy + float_offset + i * 3
+            ))
+
+    @objc.python_method
+    def _build_star_layers(self):
+        """Create sparkle and star shape layers sharing one star path."""
+        window = self.window()
+        scale = window.backingScaleFactor() if window else 1.0
+        no_anim = NSNull.null()
+        path = get_star_path()
+        color = CGColorCreateGenericRGB(1.0, 0.95, 0.4, 1.0)
+        self.star_layers = []
+        for _ in range(len(SPARKLE_POSITIONS) + 1):
+            layer = CAShapeLayer.layer()
+            layer.setPath_(path)
+            layer.setFillColor_(color)
+            layer.setContentsScale_(scale)
+            layer.setActions_({
+                'position': no_anim, 'transform': no_anim,
+                'opacity': no_anim, 'hidden': no_anim,
+            })
+            self.layer().addSublayer_(layer)
+            self.star_layers.append(layer)
+
+    @objc.python_method
+    def _layout_star_layers(self):
+        """Pulse the sparkles and spin the star for the current phase."""
+        if self.star_layers is None:
+            return
+        size = self.bounds().size
+        if 'sparkle' in self.emotions:
+            for i, (px, py) in enumerate(SPARKLE_POSITIONS):
+                # Animate sparkle size and brightness
+                wave = fast_sin(self.animation_phase + i * 0.25)
+                factor = (4 + wave * 3) / STAR_PATH_RADIUS
+                layer = self.star_layers[i]
+                layer.setPosition_((size.width * px, size.height * py))
+                layer.setAffineTransform_(
+                    CGAffineTransformMakeScale(factor, factor)
+                )
+                layer.setOpacity_(0.5 + wave * 0.4)
+        if 'star' in self.emotions:
+            # Star in top area, one full turn per phase unit
+            star = self.star_layers[-1]
+            star.setPosition_((size.width * 0.5, size.height * 0.9))
+            star.setAffineTransform_(
+                CGAffineTransformMakeRotation(
+                    self.animation_phase * 2 * math.pi
+                )
+            )
+            star.setOpacity_(0.9)
 
     def drawRect_(self, rect):
-        if not self.emotions:
+        if not self.draws_shapes:
             return
 
         bounds = self.bounds()
@@ -675,12 +1255,6 @@ class EmotionOverlayView(NSView):
         for emotion in self.emotions:
             if emotion == 'sweat_drop':
                 self._draw_sweat_drop(bounds)
-            elif emotion == 'zzz':
-                self._draw_zzz(bounds)
-            elif emotion == 'sparkle':
-                self._draw_sparkle(bounds)
-            elif emotion == 'star':
-                self._draw_star(bounds)
             elif emotion == 'focus_lines':
                 self._draw_focus_lines(bounds)
 
@@ -713,85 +1287,6 @@ class EmotionOverlayView(NSView):
         ).setFill()
         path.fill()
 
-    def _draw_zzz(self, bounds):
-        """Draw floating Zzz in top-right area."""
-        base_x = bounds.size.width * 0.8
-        base_y = bounds.size.height * 0.7
-
-        font_sizes = [14, 11, 8]
-        offsets = [(0, 0), (15, 20), (25, 35)]
-
-        # Animate floating up
-        float_offset = math.sin(self.animation_phase * 2) * 5
-
-        for i, (size, (ox, oy)) in enumerate(zip(font_sizes, offsets)):
-            font = NSFont.boldSystemFontOfSize_(size)
-            attrs = {
-                NSFontAttributeName: font,
-                NSForegroundColorAttributeName: NSColor.colorWithRed_green_blue_alpha_(  # noqa: E501
-                    0.7, 0.7, 0.9, 0.8 - i * 0.2
-                )
-            }
-            z_str = NSAttributedString.alloc().initWithString_attributes_(
-                "Z", attrs
-            )
-            z_str.drawAtPoint_(NSMakePoint(
-                base_x + ox,
-                base_y + oy + float_offset + i * 3
-            ))
-
-    def _draw_sparkle(self, bounds):
-        """Draw sparkle effects around the character."""
-        sparkle_positions = [
-            (0.15, 0.8), (0.85, 0.85), (0.9, 0.6), (0.1, 0.5)
-        ]
-
-        for i, (px, py) in enumerate(sparkle_positions):
-            x = bounds.size.width * px
-            y = bounds.size.height * py
-
-            # Animate sparkle size
-            phase = (self.animation_phase + i * 0.25) % 1.0
-            size = 4 + math.sin(phase * math.pi * 2) * 3
-            alpha = 0.5 + math.sin(phase * math.pi * 2) * 0.4
-
-            self._draw_star_shape(x, y, size, alpha)
-
-    def _draw_star(self, bounds):
-        """Draw a star in top area."""
-        x = bounds.size.width * 0.5
-        y = bounds.size.height * 0.9
-
-        # Animate rotation
-        rotation = self.animation_phase * 360
-
-        transform = NSAffineTransform.transform()
-        transform.translateXBy_yBy_(x, y)
-        transform.rotateByDegrees_(rotation)
-        transform.concat()
-
-        self._draw_star_shape(0, 0, 10, 0.9)
-
-    def _draw_star_shape(self, x, y, size, alpha):
-        """Draw a 4-pointed star shape."""
-        color = NSColor.colorWithRed_green_blue_alpha_(
-            1.0, 0.95, 0.4, alpha
-        )
-        color.setFill()
-
-        path = NSBezierPath.bezierPath()
-        # 4-pointed star
-        path.moveToPoint_(NSMakePoint(x, y + size))
-        path.lineToPoint_(NSMakePoint(x + size * 0.3, y + size * 0.3))
-        path.lineToPoint_(NSMakePoint(x + size, y))
-        path.lineToPoint_(NSMakePoint(x + size * 0.3, y - size * 0.3))
-        path.lineToPoint_(NSMakePoint(x, y - size))
-        path.lineToPoint_(NSMakePoint(x - size * 0.3, y - size * 0.3))
-        path.lineToPoint_(NSMakePoint(x - size, y))
-        path.lineToPoint_(NSMakePoint(x - size * 0.3, y + size * 0.3))
-        path.closePath()
-        path.fill()
-
     def _draw_focus_lines(self, bounds):
         """Draw focus/concentration lines around character."""
         center_x = bounds.size.width / 2
@@ -801,22 +1296,27 @@ class EmotionOverlayView(NSView):
             0.4, 0.6, 1.0, 0.3
         ).setStroke()
 
+        # All segments go into one path so the lines stroke in a single pass
+        path = NSBezierPath.bezierPath()
+        path.setLineWidth_(2)
         for i in range(8):
-            angle = (i * 45 + self.animation_phase * 30) * math.pi / 180
-            inner_r = 60 + math.sin(self.animation_phase * 3 + i) * 10
+            turns = (i * 45 + self.animation_phase * 30) / 360
+            cos_a = fast_cos(turns)
+            sin_a = fast_sin(turns)
+            inner_r = 60 + fast_sin(
+                (self.animation_phase * 3 + i) / (2 * math.pi)
+            ) * 10
             outer_r = inner_r + 20
 
-            path = NSBezierPath.bezierPath()
-            path.setLineWidth_(2)
             path.moveToPoint_(NSMakePoint(
-                center_x + math.cos(angle) * inner_r,
-                center_y + math.sin(angle) * inner_r
+                center_x + cos_a * inner_r,
+                center_y + sin_a * inner_r
             ))
             path.lineToPoint_(NSMakePoint(
-                center_x + math.cos(angle) * outer_r,
-                center_y + math.sin(angle) * outer_r
+                center_x + cos_a * outer_r,
+                center_y + sin_a * outer_r
             ))
-            path.stroke()
+        path.stroke()
 
 
 class Overlay(NSObject):
@@ -836,76 +1336,41 @@ class Overlay(NSObject):
 
         # Load settings
         self.settings = load_settings()
-        overlay_cfg = self.settings.get('overlay', {})
-        self.base_max_height = overlay_cfg.get('maxHeight', DEFAULT_MAX_HEIGHT)
-        self.max_height = self.base_max_height  # Current active max height
-        self.offset_x = overlay_cfg.get('offsetX', DEFAULT_OFFSET_X)
-        self.offset_y = overlay_cfg.get('offsetY', DEFAULT_OFFSET_Y)
-        self.responsive = overlay_cfg.get('responsive', True)
-        self.height_ratio = overlay_cfg.get(
-            'heightRatio', DEFAULT_HEIGHT_RATIO
-        )
-
-        # Bottom gradient settings
-        gradient_cfg = overlay_cfg.get('bottomGradient', {})
-        self.gradient_enabled = gradient_cfg.get('enabled', True)
-        self.gradient_percentage = gradient_cfg.get('percentage', 0.2)
-
-        # Immersion settings
-        immersion_cfg = self.settings.get('immersion', {})
-        self.breathing_enabled = immersion_cfg.get('breathing', True)
-        self.sway_enabled = immersion_cfg.get('sway', True)
-        self.cursor_influence_enabled = immersion_cfg.get(
-            'cursorInfluence', True
-        )
-        self.cursor_influence_strength = immersion_cfg.get(
-            'cursorInfluenceStrength', 0.5
-        )
-        self.transitions_enabled = immersion_cfg.get('transitions', True)
-
-        # Speech bubble settings
-        self.speech_cfg = self.settings.get('speechBubble', {})
-        self.speech_enabled = self.speech_cfg.get('enabled', True)
-        self.speech_duration = self.speech_cfg.get('displayDuration', 3.0)
-
-        # Emotion overlay settings
-        self.emotions_enabled = self.settings.get('emotionOverlays', {}).get(
-            'enabled', True
-        )
+        self.cfg = OverlayConfig.from_settings(self.settings)
+        self.bind_fade_methods()
+        self.max_height = self.cfg.max_height  # Current active max height
 
-        # Aura settings
-        aura_cfg = self.settings.get('aura', {})
-        self.aura_enabled = aura_cfg.get('enabled', True)
-        self.aura_color = hex_to_rgba(aura_cfg.get('color', '#6699ff'))
-        self.aura_opacity = aura_cfg.get('opacity', AURA_OPACITY)
-        self.aura_min_radius = aura_cfg.get('minRadius', AURA_MIN_RADIUS)
-        self.aura_max_radius = aura_cfg.get('maxRadius', AURA_MAX_RADIUS)
-        self.aura_period = aura_cfg.get('period', AURA_PERIOD)
-
-        # Audio settings (NSSound - in-process, no subprocess)
-        audio_cfg = self.settings.get('audio', {})
-        self.audio_enabled = audio_cfg.get('enabled', True)
-        self.audio_volume = audio_cfg.get('volume', 0.5)
+        # Audio state (NSSound - in-process, no subprocess)
         self.current_sound = None  # NSSound instance
         self.last_sound_time = 0.0  # Debounce timestamp
         self.sound_debounce_ms = 150  # Minimum ms between sounds
 
         # Load manifest
-        theme_name = self.settings.get('theme', 'default')
-        self.theme_path = PLUGIN_ROOT / 'themes' / theme_name
+        self.theme_path = PLUGIN_ROOT / 'themes' / self.cfg.theme
         self.manifest = self.load_manifest()
 
-        # Character folder (persisted in settings)
-        self.character_folder_override = self.settings.get(
-            'characterFolder', 'characters'
-        )
+        # Load speech messages
+        self.messages = load_messages(PLUGIN_ROOT)
 
-        # Image cache: state -> NSImage (avoids re-processing each time)
-        self._image_cache: dict = {}
+        # Resolved per-state assets: state -> StateAssets
+        self._state_assets: dict = {}
+
+        # Image cache: (path, size, gradient) -> NSImage, least recently
+        # used entries evicted beyond IMAGE_CACHE_SIZE
+        self._image_cache: OrderedDict = OrderedDict()
+        # Decoded sources scaled to base max height: path -> PIL image
+        # (responsive resizes re-scale from memory instead of the PNG)
+        self._source_cache: dict = {}
+        # Pillow work (decode/resize/gradient) runs off the main thread;
+        # only the newest request's result is shown
+        self.image_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='fx-image'
+        )
+        self.image_generation = 0
 
         # Get initial terminal position for responsive sizing
-        initial_pos = get_terminal_position()
-        if self.responsive and initial_pos:
+        initial_pos = get_terminal_position_cached()
+        if self.cfg.responsive and initial_pos:
             self.max_height = self.calculate_responsive_height(
                 initial_pos['h']
             )
@@ -916,8 +1381,9 @@ class Overlay(NSObject):
         self.height = self.max_height
         self.calculate_size('idle')
 
-        # Calculate position
-        x, y = self.calculate_position(overlay_cfg)
+        # Calculate position (screen height refreshed on display changes)
+        self.screen_height = NSScreen.mainScreen().frame().size.height
+        x, y = self.calculate_position()
 
         # Create borderless transparent window
         rect = NSMakeRect(x, y, self.width, self.height)
@@ -962,48 +1428,52 @@ class Overlay(NSObject):
         self.speech_bubble = SpeechBubbleView.alloc().initWithFrame_(
             bubble_rect
         )
-        self.speech_bubble.configure_(self.speech_cfg)
+        self.speech_bubble.configure_(self.cfg.speech)
         self.speech_bubble.setAlphaValue_(0.0)
         self.content_view.addSubview_(self.speech_bubble)
 
-        # Load speech messages
-        self.messages = load_messages(PLUGIN_ROOT)
-
         self.window.setContentView_(self.content_view)
 
         # Setup aura glow effect (layer-backed for shadow)
         self.content_view.setWantsLayer_(True)
-        layer = self.content_view.layer()
-        if self.aura_enabled:
-            layer.setShadowColor_(CGColorCreateGenericRGB(*self.aura_color))
-            layer.setShadowOpacity_(self.aura_opacity)
-            layer.setShadowRadius_(self.aura_min_radius)
-        else:
-            layer.setShadowOpacity_(0.0)
-        layer.setShadowOffset_((0, 0))  # Centered glow
+        self.content_view.layer().setShadowOffset_((0, 0))  # Centered glow
+        self.apply_aura()
 
         # State tracking
         self.current_state = 'idle'
         self.last_socket_state = None  # Track last state received via socket
+        # Socket thread -> main thread handoff, drained by the frame tick
+        self.state_queue = queue.SimpleQueue()
+        self.state_wake_posted = False  # Guarded by state_lock
+        self.driver_running = False
         self.pending_idle_timer = None
         self.load_state_image('idle', crossfade=False)
+        self.preload_state_images()
 
         # Visibility tracking - received via socket on first message
         self.terminal_pid = None
         self.terminal_window_id = None
         self.is_visible = True
         self.last_terminal_pos = None
-        self.show_only_when_active = overlay_cfg.get(
-            'showOnlyWhenTerminalActive', True
-        )
-        self.fade_animation = overlay_cfg.get('fadeAnimation', True)
         # Grace period: don't hide overlay for first 1.5s after startup
-        self.startup_time = time.time()
+        self.startup_time = time.monotonic()
+        # Settle visibility as soon as grace ends, not at the next backstop
+        self.performSelector_withObject_afterDelay_(
+            'validateVisibility:', None, STARTUP_GRACE_PERIOD
+        )
 
         # Animation state
-        self.animation_start = time.time()
+        self.animation_start = time.monotonic()
+        self.last_tick = 0.0  # Time of last rendered tick (coalescing)
+        self.min_frame_interval = MIN_FRAME_INTERVAL  # See powerStateChanged_
         self.base_y = y  # Base Y position (before float offset)
-        self.base_x = x  # Base X position
+        self.applied_y = y  # Window Y last pushed by the float animation
+        self.cursor_sample_time = 0.0  # Last cursor poll (tick clock)
+        self.cursor_tilt = 0.0
+        self.cursor_shift = 0.0
+        self.pending_max_height = None  # Responsive size awaiting settle
+        self.resize_settle_time = 0.0
+        self.base_x = x  # Window X (the float only moves Y)
 
         # Transition animation state
         self.transition_active = False
@@ -1017,50 +1487,66 @@ class Overlay(NSObject):
 
         # Don't show window yet - defer until run loop starts
         self.window.setAlphaValue_(0.0)
+        self.window_ordered_in = False  # Window in the screen list
 
         # Socket server for IPC (replaces file polling)
         self.socket_path = get_socket_path()
         self.socket_server = None
         self.socket_thread = None
         self.state_lock = threading.Lock()
+        self._torn_down = False  # Set once IPC resources are released
         self.setup_socket_server()
 
-        # Animation timer (60fps for smooth movement)
-        m = 'scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_'
-        self.timer = getattr(NSTimer, m)(
-            ANIMATION_FRAME_TIME, self, 'animationTick:', None, True
-        )
-
-        # Parent process monitor (check periodically if terminal still alive)
-        self.parent_check_timer = getattr(NSTimer, m)(
-            PARENT_CHECK_INTERVAL, self, 'checkParentAlive:', None, True
-        )
+        # Single animation driver for all effects: display link (vsync),
+        # falling back to a 60fps NSTimer
+        self.display_link = None
+        self.timer = None
+        self.tick_pending = False
+        self.start_animation_driver()
 
         # Defer window show to after run loop starts (fixes startup visibility)
-        getattr(NSTimer, m)(0.1, self, 'showWindowDeferred:', None, False)
+        self.performSelector_withObject_afterDelay_(
+            'showWindowDeferred:', None, 0.1
+        )
 
         # Subscribe to app activation notifications (event-driven visibility)
-        self.pending_show_timer = None
+        self.decision_pending = False  # Debounced focus/Space decision
+        self.decision_due = 0.0
         nc = NSWorkspace.sharedWorkspace().notificationCenter()
         nc.addObserver_selector_name_object_(
             self, 'appDidActivate:',
             'NSWorkspaceDidActivateApplicationNotification', None
         )
-        nc.addObserver_selector_name_object_(
-            self, 'appDidDeactivate:',
-            'NSWorkspaceDidDeactivateApplicationNotification', None
-        )
         nc.addObserver_selector_name_object_(
             self, 'spaceDidChange:',
             'NSWorkspaceActiveSpaceDidChangeNotification', None
         )
-
-        # Fallback validation timer - catches minimize, Space changes
-        self.validation_timer = None
-        m = 'scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_'
-        self.validation_timer = getattr(NSTimer, m)(
-            VISIBILITY_CHECK_INTERVAL, self, 'validateVisibility:', None, True
+        # Deactivate and Cmd-H hide/unhide only matter for our terminal
+        for name in ('NSWorkspaceDidDeactivateApplicationNotification',
+                     'NSWorkspaceDidHideApplicationNotification',
+                     'NSWorkspaceDidUnhideApplicationNotification'):
+            nc.addObserver_selector_name_object_(
+                self, 'terminalAppChanged:', name, None
+            )
+        center = NSNotificationCenter.defaultCenter()
+        center.addObserver_selector_name_object_(
+            self, 'screenParametersChanged:',
+            'NSApplicationDidChangeScreenParametersNotification', None
         )
+        center.addObserver_selector_name_object_(
+            self, 'powerStateChanged:',
+            'NSProcessInfoPowerStateDidChangeNotification', None
+        )
+        self.powerStateChanged_(None)
+
+        # Single housekeeping timer: a slow visibility backstop (minimizing
+        # another app's window posts no notification we can observe) and
+        # parent liveness on its own deadline
+        self.next_parent_check = time.monotonic() + PARENT_CHECK_INTERVAL
+        timer = schedule_timer(
+            VISIBILITY_CHECK_INTERVAL, self, 'housekeepingTick:', None, True
+        )
+        self.housekeeping_timer = relax_timer(timer, VISIBILITY_CHECK_INTERVAL)
 
         # Setup signal handlers for clean shutdown
         self._setup_signal_handlers()
@@ -1079,22 +1565,32 @@ class Overlay(NSObject):
     def _emergency_cleanup(self):
         """Fast cleanup without animations (for signal handlers)."""
         try:
-            if self.socket_server:
-                self.socket_server.close()
-                self.socket_server = None
-            if self.socket_path and self.socket_path.exists():
-                self.socket_path.unlink(missing_ok=True)
-            if hasattr(self, 'pid_path') and self.pid_path.exists():
-                self.pid_path.unlink(missing_ok=True)
+            self._teardown()
         except Exception:
             pass
 
+    def _teardown(self):
+        """Release socket, worker and runtime files (runs only once)."""
+        if self._torn_down:
+            return
+        self._torn_down = True
+        self._close_socket_server()
+        parent_kq = getattr(self, '_parent_kq', None)
+        if parent_kq is not None:
+            parent_kq.close()
+        self.image_executor.shutdown(wait=False, cancel_futures=True)
+        if self.socket_path:
+            self.socket_path.unlink(missing_ok=True)
+        pid_path = getattr(self, 'pid_path', None)
+        if pid_path:
+            pid_path.unlink(missing_ok=True)
+
     def load_manifest(self) -> dict:
         """Load theme manifest."""
         manifest_file = self.theme_path / 'manifest.json'
         if manifest_file.exists():
             try:
-                return json.loads(manifest_file.read_text())
+                return read_json(manifest_file)
             except Exception:
                 pass
         return {}
@@ -1118,7 +1614,21 @@ class Overlay(NSObject):
         self.socket_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         self.socket_server.bind(str(self.socket_path))
         self.socket_server.listen(5)
-        self.socket_server.settimeout(0.1)  # Non-blocking with timeout
+        self.socket_server.setblocking(False)
+
+        # Listener sleeps in the kernel (kqueue on macOS) until a client
+        # connects; the wake pipe interrupts it on shutdown.
+        self._wake_r, self._wake_w = os.pipe()
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.socket_server, selectors.EVENT_READ)
+        self.selector.register(self._wake_r, selectors.EVENT_READ)
+        # kqueue watching the terminal for exit, once its PID is known
+        self._parent_kq = None
+        # Connected clients: socket -> [pending bytes, last activity];
+        # every read lands in one reusable buffer
+        self.clients: dict = {}
+        self._rxbuf = bytearray(4096)
+        self._rxview = memoryview(self._rxbuf)
 
         # Start listener thread
         self.socket_thread = threading.Thread(
@@ -1129,13 +1639,28 @@ class Overlay(NSObject):
 
     def _cleanup_stale_sockets(self):
         """Remove sockets from dead processes."""
-        for sock_file in FX_DIR.glob('sock-*.sock'):
+        try:
+            with os.scandir(FX_DIR) as entries:
+                names = [e.name for e in entries
+                         if e.name.startswith('sock-')
+                         and e.name.endswith('.sock')]
+        except OSError:
+            return
+        for name in names:
             try:
-                session_id = sock_file.stem.replace('sock-', '')
+                session_id = name[5:-5]  # Strip 'sock-' / '.sock'
                 pid_file = FX_DIR / f'pid-{session_id}.txt'
+                try:
+                    fd = os.open(pid_file, os.O_RDONLY)
+                except FileNotFoundError:
+                    pid = None  # No PID file: socket is orphaned
+                else:
+                    try:
+                        pid = int(os.read(fd, 32))
+                    finally:
+                        os.close(fd)
 
-                if pid_file.exists():
-                    pid = int(pid_file.read_text().strip())
+                if pid is not None:
                     try:
                         os.kill(pid, 0)
                         continue  # Process alive - skip
@@ -1143,70 +1668,137 @@ class Overlay(NSObject):
                         pass  # Process dead - clean up
 
                 # Remove stale socket and PID file
-                sock_file.unlink(missing_ok=True)
-                if pid_file.exists():
-                    pid_file.unlink(missing_ok=True)
+                (FX_DIR / name).unlink(missing_ok=True)
+                pid_file.unlink(missing_ok=True)
+            except Exception:
+                pass
+
+    def _close_socket_server(self):
+        """Close the server socket and wake the listener thread."""
+        server = self.socket_server
+        self.socket_server = None
+        if server:
+            try:
+                os.write(self._wake_w, b'x')
             except Exception:
                 pass
+            try:
+                server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # Listening sockets may report ENOTCONN
+            server.close()
 
     def socket_listener_loop(self):
-        """Accept connections and process commands (runs in thread)."""
+        """Multiplex the server and its clients (runs in thread)."""
         while self.socket_server:
             try:
-                conn, _ = self.socket_server.accept()
-                self.handle_client(conn)
-            except socket.timeout:
-                continue  # Check if server still running
-            except OSError:
-                break  # Socket closed
+                # Only wake periodically while a client may have stalled
+                events = self.selector.select(
+                    CLIENT_TIMEOUT if self.clients else None
+                )
             except Exception:
-                break
-
-    def handle_client(self, conn):
-        """Process single client connection."""
+                break  # Selector closed
+            for key, _ in events:
+                sock = key.fileobj
+                if sock == self._wake_r:
+                    for conn in list(self.clients):
+                        self.drop_client(conn)
+                    return  # Shutdown requested
+                if (self._parent_kq is not None
+                        and sock == self._parent_kq.fileno()):
+                    self.selector.unregister(sock)
+                    self.schedule_shutdown()  # Parent terminal exited
+                    continue
+                if sock is self.socket_server:
+                    try:
+                        conn, _ = sock.accept()
+                    except BlockingIOError:
+                        continue  # Client went away before accept
+                    except Exception:
+                        return  # Socket closed
+                    conn.setblocking(False)
+                    self.clients[conn] = [bytearray(), time.monotonic()]
+                    self.selector.register(conn, selectors.EVENT_READ)
+                else:
+                    self.read_client(sock)
+
+            # Drop clients that connected but stopped talking
+            deadline = time.monotonic() - CLIENT_TIMEOUT
+            for conn, (_, last) in list(self.clients.items()):
+                if last < deadline:
+                    self.drop_client(conn)
+
+    def read_client(self, conn):
+        """Read what a client sent and answer each complete command."""
+        pending = self.clients[conn][0]
+        try:
+            n = conn.recv_into(self._rxbuf)
+        except BlockingIOError:
+            return
+        except OSError:
+            n = 0
         try:
-            # Receive message (max 4KB)
-            data = conn.recv(4096).decode('utf-8').strip()
-            if not data:
+            if not n:
+                # Client closed; an unterminated last message still counts
+                if pending.strip():
+                    conn.sendall(self.handle_command(bytes(pending)))
+                self.drop_client(conn)
                 return
+            pending += self._rxview[:n]
+            self.clients[conn][1] = time.monotonic()
+            for raw in split_messages(pending):
+                conn.sendall(self.handle_command(raw))
+            if len(pending) > MAX_MESSAGE_SIZE:
+                self.drop_client(conn)  # Oversized frame
+        except OSError:
+            self.drop_client(conn)  # Client went away mid-conversation
+
+    def drop_client(self, conn):
+        """Forget a client connection and close it."""
+        if self.clients.pop(conn, None) is None:
+            return
+        try:
+            self.selector.unregister(conn)
+        except Exception:
+            pass
+        conn.close()
 
-            msg = json.loads(data)
+    def handle_command(self, raw: bytes) -> bytes:
+        """Dispatch one JSON command and return the framed reply."""
+        # Health checks are the most frequent message; answer unparsed
+        if raw == PING_MESSAGE:
+            return b'PONG\n'
+        try:
+            msg = decode_message(raw)
             cmd = msg.get('cmd', 'SET_STATE')
 
             if cmd == 'PING':
-                conn.sendall(b'PONG\n')
+                return b'PONG\n'
             elif cmd == 'SHUTDOWN':
                 self.schedule_shutdown()
-                conn.sendall(b'{"status": "ok"}\n')
+                return b'{"status": "ok"}\n'
             elif cmd == 'SET_STATE':
                 self.handle_set_state(msg)
-                conn.sendall(b'{"status": "ok"}\n')
+                return b'{"status": "ok"}\n'
             elif cmd == 'CHANGE_CHARACTER':
                 folder = msg.get('folder')
-                result = self.handle_change_character(folder)
-                conn.sendall(f'{json.dumps(result)}\n'.encode('utf-8'))
+                return encode_reply(self.handle_change_character(folder))
             elif cmd == 'PLAY_SOUND':
                 state = msg.get('state', 'idle')
                 self.schedule_play_sound(state)
-                conn.sendall(b'{"status": "ok"}\n')
+                return b'{"status": "ok"}\n'
             elif cmd == 'RELOAD_SETTINGS':
-                result = self.handle_reload_settings()
-                conn.sendall(f'{json.dumps(result)}\n'.encode('utf-8'))
+                return encode_reply(self.handle_reload_settings())
             else:
-                conn.sendall(b'{"status": "error", "message": "unknown"}\n')
+                return b'{"status": "error", "message": "unknown"}\n'
         except Exception as e:
-            try:
-                err = json.dumps({"status": "error", "message": str(e)})
-                conn.sendall(f'{err}\n'.encode('utf-8'))
-            except Exception:
-                pass
-        finally:
-            conn.close()
+            return encode_reply({"status": "error", "message": str(e)})
 
     def handle_set_state(self, msg):
         """Update state from socket message (thread-safe)."""
         # Only set terminal info ONCE on first message
         # Don't overwrite - each overlay owns its own terminal window
+        new_pid = new_window_id = None
         with self.state_lock:
             if self.terminal_pid is None:
                 new_pid = msg.get('terminal_pid')
@@ -1215,16 +1807,39 @@ class Overlay(NSObject):
                     self.terminal_pid = new_pid
                 if new_window_id:
                     self.terminal_window_id = new_window_id
+        if new_pid:
+            self.watch_parent_exit(new_pid)
+        if new_pid or new_window_id:
+            # First terminal info: decide visibility now (main thread)
+            # rather than waiting for the backstop timer
+            self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                'validateVisibility:', None, False
+            )
 
-        new_state = msg.get('state', 'idle')
+        # Interned so comparisons against the state tables' literal keys
+        # short-circuit on identity
+        new_state = sys.intern(msg.get('state', 'idle'))
 
-        # Track last received state
         with self.state_lock:
+            # Repeats of the state already shown need no main-thread work.
+            # current_state is also checked so a timed state that has
+            # since returned to idle can still be re-triggered.
+            if (new_state == self.last_socket_state
+                    and new_state == self.current_state):
+                return
             self.last_socket_state = new_state
+        self.state_queue.put(new_state)
 
-        # Schedule UI update on main thread (NSTimer is main-thread only)
+        # The running frame tick drains the queue; only wake the main
+        # thread (at most once per burst) while the driver is paused
+        if self.driver_running:
+            return
+        with self.state_lock:
+            if self.state_wake_posted:
+                return
+            self.state_wake_posted = True
         self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            'updateStateFromSocket:', new_state, False
+            'updateStateFromSocket:', None, False
         )
 
     def handle_change_character(self, folder: str) -> dict:
@@ -1247,7 +1862,7 @@ class Overlay(NSObject):
 
         # Set override (thread-safe)
         with self.state_lock:
-            self.character_folder_override = folder
+            self.cfg.character_folder = folder
             # Save to settings file for persistence
             self.settings['characterFolder'] = folder
             save_settings(self.settings)
@@ -1285,84 +1900,24 @@ class Overlay(NSObject):
 
     def applyReloadedSettings(self):
         """Apply reloaded settings to overlay (main thread)."""
-        # Overlay settings
-        overlay_cfg = self.settings.get('overlay', {})
-        self.base_max_height = overlay_cfg.get('maxHeight', DEFAULT_MAX_HEIGHT)
-        self.offset_x = overlay_cfg.get('offsetX', DEFAULT_OFFSET_X)
-        self.offset_y = overlay_cfg.get('offsetY', DEFAULT_OFFSET_Y)
-        self.custom_x = overlay_cfg.get('customX')
-        self.custom_y = overlay_cfg.get('customY')
-        self.responsive = overlay_cfg.get('responsive', True)
-        self.show_only_when_active = overlay_cfg.get(
-            'showOnlyWhenTerminalActive', True
-        )
-        self.fade_animation = overlay_cfg.get('fadeAnimation', True)
-
-        # Bottom gradient
-        gradient_cfg = overlay_cfg.get('bottomGradient', {})
-        self.gradient_enabled = gradient_cfg.get('enabled', True)
-        self.gradient_percentage = gradient_cfg.get('percentage', 0.8)
-
-        # Audio settings
-        audio_cfg = self.settings.get('audio', {})
-        self.audio_enabled = audio_cfg.get('enabled', True)
-        self.audio_volume = audio_cfg.get('volume', 0.5)
-
-        # Immersion settings
-        immersion_cfg = self.settings.get('immersion', {})
-        self.breathing_enabled = immersion_cfg.get('breathing', True)
-        self.sway_enabled = immersion_cfg.get('sway', True)
-        self.cursor_influence_enabled = immersion_cfg.get(
-            'cursorInfluence', True
-        )
-        self.cursor_influence_strength = immersion_cfg.get(
-            'cursorInfluenceStrength', 0.5
-        )
-        self.transitions_enabled = immersion_cfg.get('transitions', True)
-
-        # Speech bubble settings
-        self.speech_cfg = self.settings.get('speechBubble', {})
-        self.speech_enabled = self.speech_cfg.get('enabled', True)
-        self.speech_duration = self.speech_cfg.get('displayDuration', 3.0)
-
-        # Emotion overlay settings
-        self.emotions_enabled = self.settings.get('emotionOverlays', {}).get(
-            'enabled', True
-        )
-
-        # Aura settings
-        aura_cfg = self.settings.get('aura', {})
-        self.aura_enabled = aura_cfg.get('enabled', True)
-        self.aura_color = hex_to_rgba(aura_cfg.get('color', '#6699ff'))
-        self.aura_opacity = aura_cfg.get('opacity', AURA_OPACITY)
-        self.aura_min_radius = aura_cfg.get('minRadius', AURA_MIN_RADIUS)
-        self.aura_max_radius = aura_cfg.get('maxRadius', AURA_MAX_RADIUS)
-        self.aura_period = aura_cfg.get('period', AURA_PERIOD)
+        self.cfg = OverlayConfig.from_settings(self.settings)
+        self.bind_fade_methods()
 
         # Update aura layer
-        layer = self.content_view.layer()
-        if self.aura_enabled:
-            layer.setShadowColor_(CGColorCreateGenericRGB(*self.aura_color))
-            layer.setShadowOpacity_(self.aura_opacity)
-            layer.setShadowRadius_(self.aura_min_radius)
-        else:
-            layer.setShadowOpacity_(0.0)
-
-        # Character folder
-        self.character_folder_override = self.settings.get(
-            'characterFolder', 'characters'
-        )
+        self.apply_aura()
 
-        # Clear image cache to force reload with new settings
-        self._image_cache = {}
+        # Clear image caches to force reload with new settings
+        self._state_assets.clear()
+        self._image_cache.clear()
+        self._source_cache = {}
 
         # Recalculate responsive height if enabled
-        if self.responsive:
-            pos = get_terminal_position()
+        if self.cfg.responsive:
+            pos = get_terminal_position_cached()
             if pos:
-                self.max_height = self.calculate_responsive_height(pos)
+                self.max_height = self.calculate_responsive_height(pos['h'])
             else:
-                self.max_height = self.base_max_height
+                self.max_height = self.cfg.max_height
 
         # Reload current image with new settings
         self.reloadCurrentImage()
@@ -1375,11 +1930,11 @@ class Overlay(NSObject):
 
     def playSoundForState_(self, state: str):
         """Play sound for state using NSSound (main thread)."""
-        if not self.audio_enabled:
+        if not self.cfg.audio_enabled:
             return
 
         # Debounce: skip if sound played too recently
-        now = time.time() * 1000  # ms
+        now = time.monotonic() * 1000  # ms
         if (now - self.last_sound_time) < self.sound_debounce_ms:
             return
         self.last_sound_time = now
@@ -1399,17 +1954,36 @@ class Overlay(NSObject):
             str(sound_path), False  # False = copy data for reliable stop()
         )
         if sound:
-            sound.setVolume_(self.audio_volume)
+            sound.setVolume_(self.cfg.audio_volume)
             sound.play()
             self.current_sound = sound
 
     def reloadCurrentImage(self):
         """Reload current state image (after character folder change)."""
+        # Entries for the previous character will not be used again
+        self._state_assets.clear()
+        self._image_cache.clear()
+        self._source_cache = {}
         self.load_state_image(self.current_state, crossfade=True)
+        self.preload_state_images()
 
-    def updateStateFromSocket_(self, new_state):
-        """Update state on main thread (called from socket thread)."""
-        if new_state != self.current_state:
+    def updateStateFromSocket_(self, _):
+        """Drain queued socket states (wakeup while the driver is paused)."""
+        with self.state_lock:
+            self.state_wake_posted = False
+        self.drain_state_queue()
+
+    @objc.python_method
+    def drain_state_queue(self):
+        """Apply the latest state queued by the socket thread, if any."""
+        new_state = None
+        get = self.state_queue.get_nowait
+        while True:
+            try:
+                new_state = get()
+            except queue.Empty:
+                break
+        if new_state is not None and new_state != self.current_state:
             self.change_state(new_state)
 
     def schedule_shutdown(self):
@@ -1418,6 +1992,38 @@ class Overlay(NSObject):
             'shutdown', None, False
         )
 
+    def housekeepingTick_(self, timer):
+        """Run periodic checks that share one timer."""
+        now = time.monotonic()
+        # Polled only while no kqueue watch will report the exit
+        if self._parent_kq is None and now >= self.next_parent_check:
+            self.next_parent_check = now + PARENT_CHECK_INTERVAL
+            self.checkParentAlive_(None)
+        self.validateVisibility_(None)
+
+    @objc.python_method
+    def watch_parent_exit(self, pid: int):
+        """Have the listener hear the terminal's exit from kqueue.
+
+        Runs on the listener thread, which owns the selector. Where kqueue
+        is unavailable, or the watch can't be armed, housekeeping keeps
+        polling the PID instead.
+        """
+        if not hasattr(select, 'kqueue'):
+            return
+        kq = select.kqueue()
+        try:
+            kq.control([select.kevent(
+                pid, select.KQ_FILTER_PROC,
+                select.KQ_EV_ADD | select.KQ_EV_ONESHOT, select.KQ_NOTE_EXIT
+            )], 0)
+            # A kqueue fd turns readable once one of its events fires
+            self.selector.register(kq.fileno(), selectors.EVENT_READ)
+        except (OSError, ValueError):
+            kq.close()  # e.g. already gone; the poll will notice
+            return
+        self._parent_kq = kq
+
     def checkParentAlive_(self, timer):
         """Check if parent terminal is still alive (every 2s)."""
         if not self.terminal_pid:
@@ -1431,13 +2037,40 @@ class Overlay(NSObject):
         except PermissionError:
             pass  # Process exists but we can't signal it - that's fine
 
-    def calculate_position(self, overlay_cfg: dict) -> tuple:
+    @objc.python_method
+    def apply_aura(self):
+        """Set up the glow and hand its pulse to Core Animation.
+
+        The render server eases shadowRadius between the configured radii,
+        so the pulse costs no per-frame Python work or layer commits.
+        """
+        layer = self.content_view.layer()
+        layer.removeAnimationForKey_('aura')
+        if not self.cfg.aura_enabled:
+            layer.setShadowOpacity_(0.0)
+            return
+        layer.setShadowColor_(CGColorCreateGenericRGB(*self.cfg.aura_color))
+        layer.setShadowOpacity_(self.cfg.aura_opacity)
+        layer.setShadowRadius_(self.cfg.aura_min_radius)
+
+        pulse = CABasicAnimation.animationWithKeyPath_('shadowRadius')
+        pulse.setFromValue_(self.cfg.aura_min_radius)
+        pulse.setToValue_(self.cfg.aura_max_radius)
+        pulse.setDuration_(self.cfg.aura_period / 2)  # Out, then back
+        pulse.setAutoreverses_(True)
+        pulse.setRepeatCount_(float('inf'))
+        pulse.setTimingFunction_(CAMediaTimingFunction.functionWithName_(
+            kCAMediaTimingFunctionEaseInEaseOut
+        ))
+        layer.addAnimation_forKey_(pulse, 'aura')
+
+    def calculate_position(self) -> tuple:
         """Calculate window position based on settings."""
-        screen_height = NSScreen.mainScreen().frame().size.height
+        screen_height = self.screen_height
 
         # Check for custom position
-        custom_x = overlay_cfg.get('customX')
-        custom_y = overlay_cfg.get('customY')
+        custom_x = self.cfg.custom_x
+        custom_y = self.cfg.custom_y
 
         if custom_x is not None and custom_y is not None:
             # Use custom position (convert Y from top to bottom)
@@ -1445,137 +2078,237 @@ class Overlay(NSObject):
             y = screen_height - custom_y - self.height
         else:
             # Auto-detect terminal position
-            pos = get_terminal_position()
-            x = pos['x'] + pos['w'] - self.width - self.offset_x
-            y = screen_height - pos['y'] - self.offset_y - self.height
+            pos = get_terminal_position_cached()
+            x = pos['x'] + pos['w'] - self.width - self.cfg.offset_x
+            y = screen_height - pos['y'] - self.cfg.offset_y - self.height
 
         return x, y
 
     def calculate_responsive_height(self, terminal_height: int) -> int:
         """Calculate max height based on terminal size."""
-        if not self.responsive or not terminal_height:
-            return self.base_max_height
-        # Use ratio of terminal height, but cap at base_max_height
-        responsive_h = int(terminal_height * self.height_ratio)
-        return min(responsive_h, self.base_max_height)
-
-    def calculate_size(self, state: str):
-        """Calculate image size maintaining aspect ratio."""
+        if not self.cfg.responsive or not terminal_height:
+            return self.cfg.max_height
+        # Use ratio of terminal height, but cap at the configured max
+        responsive_h = int(terminal_height * self.cfg.height_ratio)
+        return min(responsive_h, self.cfg.max_height)
+
+    def get_state_assets(self, state: str) -> StateAssets:
+        """Return cached assets for a state, resolving them on first use."""
+        assets = self._state_assets.get(state)
+        if assets is None:
+            assets = self.build_state_assets(state)
+            self._state_assets[state] = assets
+        return assets
+
+    def build_state_assets(self, state: str) -> StateAssets:
+        """Resolve image path, native size, messages and effects."""
         states = self.manifest.get('states', {})
-        state_config = states.get(state, states.get('idle', {}))
+        # Use greeting image for farewell (wave goodbye)
+        lookup_state = 'greeting' if state == 'farewell' else state
+        state_config = states.get(lookup_state, states.get('idle', {}))
         animation = state_config.get('animation', '')
 
+        img_path = None
+        size = None
         if animation:
-            img_path = self.theme_path / animation
-            if img_path.exists():
-                img = NSImage.alloc().initWithContentsOfFile_(str(img_path))
-                if img:
-                    size = img.size()
-                    if size.height > self.max_height:
-                        ratio = self.max_height / size.height
-                        self.width = int(size.width * ratio)
-                        self.height = self.max_height
-                    else:
-                        self.width = int(size.width)
-                        self.height = int(size.height)
+            # Apply character folder override if set
+            path = self.theme_path / animation
+            if self.cfg.character_folder:
+                override = self.theme_path / animation.replace(
+                    'characters/', f'{self.cfg.character_folder}/', 1
+                )
+                # Fallback to original if override path doesn't exist
+                if override.exists():
+                    path = override
+
+            if path.exists():
+                img_path = path
+                # PNG header gives the size; only other formats are decoded
+                size = read_png_size(path)
+                if size is None:
+                    img = NSImage.alloc().initWithContentsOfFile_(str(path))
+                    if img:
+                        native = img.size()
+                        size = (native.width, native.height)
+
+        return StateAssets(
+            img_path, size,
+            self.messages.get(state, []),
+            EMOTION_OVERLAYS.get(state, []),
+            STATE_TRANSITIONS.get(state, {}),
+        )
+
+    @objc.python_method
+    def state_image_size(self, state: str) -> Optional[tuple]:
+        """Display size of a state's image, capped at the current max."""
+        size = self.get_state_assets(state).size
+        if not size:
+            return None
+        width, height = size
+        if height > self.max_height:
+            ratio = self.max_height / height
+            return int(width * ratio), self.max_height
+        return int(width), int(height)
+
+    def calculate_size(self, state: str):
+        """Calculate image size maintaining aspect ratio."""
+        size = self.state_image_size(state)
+        if size:
+            self.width, self.height = size
+
+    def load_source_image(self, img_path: Path) -> Image.Image:
+        """Decode an image once as RGBA, no taller than the base max."""
+        key = str(img_path)
+        src = self._source_cache.get(key)
+        if src is None:
+            # Single pass over the file; the handle is closed on exit
+            with Image.open(key) as img:
+                src = img
+                # Normalize once so the gradient/bitmap steps never convert
+                if src.mode != 'RGBA':
+                    src = src.convert('RGBA')
+                if src.height > self.cfg.max_height:
+                    ratio = self.cfg.max_height / src.height
+                    src = src.resize(
+                        (max(1, int(src.width * ratio)), self.cfg.max_height),
+                        Image.Resampling.LANCZOS
+                    )
+                elif src is img:
+                    src = img.copy()  # Detach pixels from the closed file
+            self._source_cache[key] = src
+        return src
 
     def load_state_image(self, state: str, crossfade: bool = True):
         """Load image for a given state with optional bottom gradient."""
         self.current_state = state
+        self.image_generation += 1
 
-        states = self.manifest.get('states', {})
-        # Use greeting image for farewell (wave goodbye)
-        lookup_state = 'greeting' if state == 'farewell' else state
-        state_config = states.get(lookup_state, states.get('idle', {}))
-        animation = state_config.get('animation', '')
+        img_path = self.get_state_assets(state).img_path
+        if img_path is None:
+            return
 
-        if animation:
-            # Apply character folder override if set
-            original_animation = animation
-            if self.character_folder_override:
-                animation = animation.replace(
-                    'characters/', f'{self.character_folder_override}/', 1
-                )
+        cache_key = self.image_cache_key(img_path, self.width, self.height)
 
-            img_path = self.theme_path / animation
+        # Check cache first
+        img = self._image_cache.get(cache_key)
+        if img is not None:
+            self._image_cache.move_to_end(cache_key)
+            if not self.cfg.use_gradient:
+                img.setSize_((self.width, self.height))  # Shared by sizes
+            self.show_state_image(img, crossfade)
+            return
 
-            # Fallback to original if override path doesn't exist
-            if self.character_folder_override and not img_path.exists():
-                img_path = self.theme_path / original_animation
+        if self.cfg.use_gradient:
+            # PIL path: load, resize, apply gradient on the worker thread.
+            # The source is already Lanczos-capped to maxHeight, so the
+            # per-size step is a mild rescale; the configured filter
+            # (bicubic by default) is indistinguishable at overlay sizes.
+            self.image_executor.submit(
+                self.prepare_state_image, self.image_generation, cache_key,
+                img_path, self.cfg.resize_filter, crossfade
+            )
+            return
 
-            if img_path.exists():
-                # Build cache key (path + size + gradient settings)
-                cache_key = (
-                    str(img_path), self.width, self.height,
-                    self.gradient_enabled, self.gradient_percentage
-                )
+        # Direct NSImage path (no gradient)
+        try:
+            img = NSImage.alloc().initWithContentsOfFile_(str(img_path))
+        except Exception:
+            return  # Image load failed - skip silently
+        if img:
+            img.setSize_((self.width, self.height))
+            self.store_state_image(cache_key, img)
+            self.show_state_image(img, crossfade)
 
-                # Check cache first
-                img = self._image_cache.get(cache_key)
+    @objc.python_method
+    def image_cache_key(self, img_path: Path, width: int,
+                        height: int) -> tuple:
+        """Cache key for a state image (path, plus size/gradient if baked)."""
+        if not self.cfg.use_gradient:
+            # File-backed NSImages scale when drawn; one serves every size
+            return (str(img_path),)
+        return (str(img_path), width, height, self.cfg.gradient_percentage)
 
-                if img is None:
-                    # Cache miss - load and process image
-                    try:
-                        use_gradient = (
-                            self.gradient_enabled
-                            and self.gradient_percentage > 0
-                        )
-                        if use_gradient:
-                            # PIL path: load, resize, apply gradient
-                            pil_img = Image.open(str(img_path))
-                            if pil_img.mode not in ('RGBA', 'RGB'):
-                                pil_img = pil_img.convert('RGBA')
-                            pil_img = pil_img.resize(
-                                (self.width, self.height),
-                                Image.Resampling.LANCZOS
-                            )
-                            pil_img = apply_bottom_gradient(
-                                pil_img, self.gradient_percentage
-                            )
-                            img = pil_to_nsimage(pil_img)
-                        else:
-                            # Direct NSImage path (no gradient)
-                            img = NSImage.alloc().initWithContentsOfFile_(
-                                str(img_path)
-                            )
-                            if img:
-                                img.setSize_((self.width, self.height))
-
-                        # Store in cache
-                        if img:
-                            self._image_cache[cache_key] = img
-                    except Exception:
-                        # Image load failed - skip silently
-                        return
+    @objc.python_method
+    def preload_state_images(self):
+        """Render the other states' gradient images on the worker.
+
+        Queued behind the image on screen, so a first visit to a state
+        finds its image cached instead of waiting on Pillow mid-change.
+        """
+        if not self.cfg.use_gradient:
+            return  # Direct NSImage loads are cheap and decode lazily
+        # The image on screen is already queued by load_state_image
+        current = self.get_state_assets(self.current_state).img_path
+        queued = {self.image_cache_key(current, self.width, self.height)}
+        for state in STATE_DURATIONS:
+            img_path = self.get_state_assets(state).img_path
+            size = self.state_image_size(state)
+            if img_path is None or size is None:
+                continue
+            cache_key = self.image_cache_key(img_path, *size)
+            if cache_key in queued or cache_key in self._image_cache:
+                continue
+            queued.add(cache_key)
+            # No generation: the result is only cached, never shown
+            self.image_executor.submit(
+                self.prepare_state_image, None, cache_key, img_path,
+                self.cfg.resize_filter, False
+            )
 
-                if img:
-                    if crossfade and self.fade_animation:
-                        self.crossfade_to_image(img)
-                    else:
-                        self.image_view_front.setImage_(img)
+    @objc.python_method
+    def prepare_state_image(self, generation: Optional[int],
+                            cache_key: tuple,
+                            img_path: Path, resample, crossfade: bool):
+        """Build a gradient NSImage (worker thread), then hand it to main."""
+        _, width, height, percentage = cache_key
+        try:
+            pil_img = self.load_source_image(img_path)
+            pil_img = pil_img.resize((width, height), resample)
+            pil_img = apply_bottom_gradient(pil_img, percentage)
+            img = pil_to_nsimage(pil_img)
+        except Exception:
+            return  # Image load failed - skip silently
+        self.performSelectorOnMainThread_withObject_waitUntilDone_(
+            'installPreparedImage:', (generation, cache_key, img, crossfade),
+            False
+        )
+
+    def installPreparedImage_(self, job):
+        """Cache a worker-built image and show it if still current (main)."""
+        generation, cache_key, img, crossfade = job
+        self.store_state_image(cache_key, img)
+        if generation == self.image_generation:
+            self.show_state_image(img, crossfade)
+
+    def store_state_image(self, cache_key: tuple, img):
+        """Store in cache, evicting least recently used."""
+        self._image_cache[cache_key] = img
+        if len(self._image_cache) > IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+
+    def show_state_image(self, img, crossfade: bool):
+        """Put an image on screen, crossfading if enabled."""
+        if crossfade and self.cfg.fade_animation:
+            self.crossfade_to_image(img)
+        else:
+            self.image_view_front.setImage_(img)
 
     def crossfade_to_image(self, new_image):
         """Smoothly transition to new image."""
         # Load new image into back view
         self.image_view_back.setImage_(new_image)
 
-        # Animate crossfade
+        # Animate crossfade; swap references once the fade has finished
         NSAnimationContext.beginGrouping()
         try:
             ctx = NSAnimationContext.currentContext()
             ctx.setDuration_(CROSSFADE_DURATION)
+            ctx.setCompletionHandler_(lambda: self.swapImageViews_(None))
             self.image_view_front.animator().setAlphaValue_(0.0)
             self.image_view_back.animator().setAlphaValue_(1.0)
         finally:
             NSAnimationContext.endGrouping()
 
-        # Swap references after animation
-        timer_method = 'scheduledTimerWithTimeInterval_' \
-            'target_selector_userInfo_repeats_'
-        getattr(NSTimer, timer_method)(
-            CROSSFADE_DURATION + 0.05, self, 'swapImageViews:', None, False
-        )
-
     def swapImageViews_(self, timer):
         """Swap front/back views after crossfade."""
         self.image_view_front, self.image_view_back = \
@@ -1607,11 +2340,10 @@ class Overlay(NSObject):
         # Schedule return to idle if temporal state
         duration = STATE_DURATIONS.get(new_state)
         if duration:
-            timer_method = 'scheduledTimerWithTimeInterval_' \
-                'target_selector_userInfo_repeats_'
-            self.pending_idle_timer = getattr(NSTimer, timer_method)(
+            timer = schedule_timer(
                 duration, self, 'returnToIdle:', None, False
             )
+            self.pending_idle_timer = relax_timer(timer, duration)
 
     def returnToIdle_(self, timer):
         """Auto-transition back to idle state or shutdown if farewell."""
@@ -1623,10 +2355,10 @@ class Overlay(NSObject):
 
     def start_transition(self, state: str):
         """Start a transition animation for the given state."""
-        if not self.transitions_enabled:
+        if not self.cfg.transitions:
             return
 
-        config = STATE_TRANSITIONS.get(state, {})
+        config = self.get_state_assets(state).transition
         trans_type = config.get('type', TRANSITION_NONE)
 
         if trans_type == TRANSITION_NONE:
@@ -1634,13 +2366,13 @@ class Overlay(NSObject):
 
         self.transition_active = True
         self.transition_type = trans_type
-        self.transition_start = time.time()
+        self.transition_start = time.monotonic()
         self.transition_duration = config.get('duration', 0.3)
         self.transition_params = config
 
     def show_speech_bubble(self, state: str):
         """Show a speech bubble with a random message for the state."""
-        if not self.speech_enabled:
+        if not self.cfg.speech_enabled:
             return
 
         # Cancel any pending hide timer
@@ -1649,7 +2381,7 @@ class Overlay(NSObject):
             self.speech_hide_timer = None
 
         # Get messages for this state
-        state_messages = self.messages.get(state, [])
+        state_messages = self.get_state_assets(state).messages
         if not state_messages:
             self.hide_speech_bubble()
             return
@@ -1667,11 +2399,10 @@ class Overlay(NSObject):
             NSAnimationContext.endGrouping()
 
         # Schedule hide after duration
-        timer_method = 'scheduledTimerWithTimeInterval_' \
-            'target_selector_userInfo_repeats_'
-        self.speech_hide_timer = getattr(NSTimer, timer_method)(
-            self.speech_duration, self, 'hideSpeechBubble:', None, False
+        timer = schedule_timer(
+            self.cfg.speech_duration, self, 'hideSpeechBubble:', None, False
         )
+        self.speech_hide_timer = relax_timer(timer, self.cfg.speech_duration)
 
     def hideSpeechBubble_(self, timer):
         """Timer callback to hide speech bubble."""
@@ -1689,12 +2420,12 @@ class Overlay(NSObject):
 
     def set_emotion_overlays(self, state: str):
         """Set emotion overlays for the current state."""
-        if not self.emotions_enabled:
+        if not self.cfg.emotions:
             self.emotion_view.setEmotions_([])
             self.emotion_view.setAlphaValue_(0.0)
             return
 
-        emotions = EMOTION_OVERLAYS.get(state, [])
+        emotions = self.get_state_assets(state).emotions
         self.emotion_view.setEmotions_(emotions)
 
         if emotions:
@@ -1716,55 +2447,40 @@ class Overlay(NSObject):
 
     def shutdown(self):
         """Clean shutdown - fade out and exit."""
-        self.fadeOut()
+        self.hide_now()
         # Schedule actual exit after fade completes
-        timer_method = 'scheduledTimerWithTimeInterval_' \
-            'target_selector_userInfo_repeats_'
-        getattr(NSTimer, timer_method)(
-            0.5, self, 'exitApp:', None, False
-        )
+        self.performSelector_withObject_afterDelay_('exitApp:', None, 0.5)
 
     def exitApp_(self, timer):
         """Exit the application cleanly."""
-        # Remove notification observer
+        # Remove notification observers
         nc = NSWorkspace.sharedWorkspace().notificationCenter()
         nc.removeObserver_(self)
-        # Stop the animation timer
-        if self.timer:
-            self.timer.invalidate()
-            self.timer = None
-        # Stop parent check timer
-        if hasattr(self, 'parent_check_timer') and self.parent_check_timer:
-            self.parent_check_timer.invalidate()
-            self.parent_check_timer = None
-        # Stop validation timer
-        if hasattr(self, 'validation_timer') and self.validation_timer:
-            self.validation_timer.invalidate()
-            self.validation_timer = None
+        NSNotificationCenter.defaultCenter().removeObserver_(self)
+        # Stop the animation driver
+        self.stop_animation_driver()
+        # Stop housekeeping (validation + parent check) timer
+        if hasattr(self, 'housekeeping_timer') and self.housekeeping_timer:
+            self.housekeeping_timer.invalidate()
+            self.housekeeping_timer = None
         # Cancel any pending timers
         if self.pending_idle_timer:
             self.pending_idle_timer.invalidate()
             self.pending_idle_timer = None
-        self.cancel_pending_show()
-        # Close socket server
-        if self.socket_server:
-            self.socket_server.close()
-            self.socket_server = None
-        # Clean up socket file
-        if self.socket_path.exists():
-            self.socket_path.unlink(missing_ok=True)
-        # Clean up PID file
-        if hasattr(self, 'pid_path') and self.pid_path.exists():
-            self.pid_path.unlink(missing_ok=True)
+        self.cancel_visibility_decision()
+        # Close socket server, drop queued image work, remove runtime files
+        self._teardown()
         # Terminate
         self.app.terminate_(None)
 
     def resize_window(self):
         """Resize window and image views to current size."""
-        frame = self.window.frame()
-        frame.size.width = self.width
-        frame.size.height = self.height
-        self.window.setFrame_display_(frame, True)
+        # Origin comes from the tracked position; no frame() round-trip
+        frame = NSMakeRect(
+            self.base_x, self.applied_y, self.width, self.height
+        )
+        # Layer-backed content redraws at the next commit; no forced display
+        self.window.setFrame_display_(frame, False)
         view_rect = NSMakeRect(0, 0, self.width, self.height)
         self.content_view.setFrame_(view_rect)
         self.image_view_front.setFrame_(view_rect)
@@ -1772,176 +2488,274 @@ class Overlay(NSObject):
 
     def get_pid_from_window_id(self, window_id: int) -> Optional[int]:
         """Get the owner PID of a window by its ID."""
+        # Ask about this one window (on screen or not), not the whole list
         try:
             windows = CGWindowListCopyWindowInfo(
-                kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+                kCGWindowListOptionIncludingWindow, window_id
             )
-            for w in windows:
-                if w.get('kCGWindowNumber') == window_id:
-                    return w.get('kCGWindowOwnerPID')
         except Exception:
-            pass
-        return None
+            return None
+        return windows[0].get('kCGWindowOwnerPID') if windows else None
 
     def update_position(self, pos: dict):
         """Update overlay position to follow terminal."""
-        screen_height = NSScreen.mainScreen().frame().size.height
-        x = pos['x'] + pos['w'] - self.width - self.offset_x
-        y = screen_height - pos['y'] - self.offset_y - self.height
+        screen_height = self.screen_height
+        x = pos['x'] + pos['w'] - self.width - self.cfg.offset_x
+        y = screen_height - pos['y'] - self.cfg.offset_y - self.height
 
         # Store base position for floating animation
+        self.base_x = x
         self.base_y = y
+        self.applied_y = y
+
+        frame = NSMakeRect(x, y, self.width, self.height)
+        self.window.setFrame_display_(frame, False)
+
+    def screenParametersChanged_(self, notification):
+        """Display added/removed/resized: refresh height and reposition."""
+        self.screen_height = NSScreen.mainScreen().frame().size.height
+        if self.last_terminal_pos:
+            self.update_position(self.last_terminal_pos)
+
+    def powerStateChanged_(self, notification):
+        """Halve the animation frame rate while Low Power Mode is on."""
+        try:
+            low_power = NSProcessInfo.processInfo().isLowPowerModeEnabled()
+        except AttributeError:
+            low_power = False  # Before macOS 12
+        self.min_frame_interval = (
+            LOW_POWER_FRAME_INTERVAL if low_power else MIN_FRAME_INTERVAL
+        )
+
+    def start_animation_driver(self):
+        """Start the display link, or a 60fps NSTimer if unavailable."""
+        self.driver_running = True
+        if self.display_link is not None:
+            CVDisplayLinkStart(self.display_link)  # Resume after a pause
+            return
+        if self.timer:
+            return
+        try:
+            err, link = CVDisplayLinkCreateWithActiveCGDisplays(None)
+            if err == kCVReturnSuccess and link is not None:
+                CVDisplayLinkSetOutputCallback(
+                    link, self.on_display_link, None
+                )
+                if CVDisplayLinkStart(link) == kCVReturnSuccess:
+                    self.display_link = link
+                    return
+        except Exception:
+            pass
+
+        self.timer = schedule_timer(
+            ANIMATION_FRAME_TIME, self, 'animationTick:', None, True
+        )
+        # A few ms of slack lets the OS coalesce wakeups with other timers
+        self.timer.setTolerance_(ANIMATION_TIMER_TOLERANCE)
+
+    def pause_animation_driver(self):
+        """Stop frame callbacks while hidden (display link is kept)."""
+        self.driver_running = False
+        if self.display_link is not None:
+            CVDisplayLinkStop(self.display_link)
+        if self.timer:
+            self.timer.invalidate()
+            self.timer = None
+        # States queued before the socket thread saw the flag flip
+        if not self.state_queue.empty():
+            self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                'updateStateFromSocket:', None, False
+            )
+
+    def stop_animation_driver(self):
+        """Stop whichever animation driver is running."""
+        self.driver_running = False
+        if self.display_link is not None:
+            CVDisplayLinkStop(self.display_link)
+            self.display_link = None
+        if self.timer:
+            self.timer.invalidate()
+            self.timer = None
 
-        frame = self.window.frame()
-        frame.origin.x = x
-        frame.origin.y = y
-        self.window.setFrame_display_(frame, True)
+    @objc.python_method
+    def on_display_link(self, link, now, output_time, flags_in, flags_out,
+                        context):
+        """Display link callback (CoreVideo thread): hop to main thread."""
+        # Mid fade-out (link not yet stopped) there is nothing to animate;
+        # only wake the main thread if socket states are waiting
+        if not self.is_visible and self.state_queue.empty():
+            return kCVReturnSuccess
+        # At most one tick queued; a busy main thread drops frames
+        if not self.tick_pending:
+            self.tick_pending = True
+            self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                'animationTick:', None, False
+            )
+        return kCVReturnSuccess
 
     def animationTick_(self, timer):
-        """Run animations and track terminal position (called by NSTimer)."""
+        """Run animations and track terminal position (once per frame)."""
+        self.tick_pending = False
         try:
+            self.drain_state_queue()
+
+            # Hidden (or fading out): no transform, frame or shadow writes;
+            # they would only cost CoreAnimation commits nobody sees
+            if not self.is_visible:
+                return
+
+            # Coalesce ticks that fire faster than one frame interval
+            # (e.g. a late timer catching up); render only the latest.
+            now = time.monotonic()
+            if now - self.last_tick < self.min_frame_interval:
+                return
+            self.last_tick = now
+
             # Visibility check during startup grace period
-            in_grace = (time.time() - self.startup_time) < STARTUP_GRACE_PERIOD
-            if in_grace and self.show_only_when_active:
-                if not is_our_window_frontmost(
+            in_grace = (now - self.startup_time) < STARTUP_GRACE_PERIOD
+            if in_grace and self.cfg.show_only_when_active:
+                if not is_our_window_frontmost_cached(
                     self.terminal_pid, self.terminal_window_id
                 ):
-                    if self.is_visible:
-                        self.fadeOut()
+                    self.hide_now()
+                    return
 
             # Track terminal position and size (follow window)
-            if self.is_visible and self.terminal_window_id:
+            if self.terminal_window_id:
                 current_pos = get_terminal_window_position_cached(
                     self.terminal_window_id
                 )
                 if current_pos:
-                    # Check if terminal size changed (responsive resize)
+                    # Check if terminal size changed (responsive resize);
+                    # apply only once the height has settled so a drag
+                    # doesn't re-render the image every frame
                     old_h = self.last_terminal_pos.get('h') if \
                         self.last_terminal_pos else None
-                    if self.responsive and old_h != current_pos['h']:
+                    if self.cfg.responsive and old_h != current_pos['h']:
                         new_max = self.calculate_responsive_height(
                             current_pos['h']
                         )
                         if new_max != self.max_height:
-                            self.max_height = new_max
-                            self.calculate_size(self.current_state)
-                            self.load_state_image(
-                                self.current_state, crossfade=False
-                            )
-                            self.resize_window()
+                            self.pending_max_height = new_max
+                            self.resize_settle_time = now + RESIZE_SETTLE
+                        else:
+                            self.pending_max_height = None
 
                     # Update position if changed
                     if current_pos != self.last_terminal_pos:
                         self.last_terminal_pos = current_pos
                         self.update_position(current_pos)
 
-            # Run animations every frame
-            if self.is_visible:
-                elapsed = time.time() - self.animation_start
-                now = time.time()
-
-                # Initialize transform values
-                rotation = 0.0
-                scale_x = 1.0
-                scale_y = 1.0
-                offset_x = 0.0
-                offset_y = 0.0
-
-                # Floating: subtle vertical sine wave (window position)
-                float_offset = FLOAT_AMPLITUDE * math.sin(
-                    2 * math.pi * elapsed / FLOAT_PERIOD
-                )
-
-                # Breathing: subtle Y-axis scale pulse
-                if self.breathing_enabled:
-                    breath = math.sin(2 * math.pi * elapsed / BREATH_PERIOD)
-                    scale_y = 1.0 + (breath * BREATH_INTENSITY)
-
-                # Sway: gentle rotation and horizontal drift
-                if self.sway_enabled:
-                    sway_phase = 2 * math.pi * elapsed / SWAY_PERIOD
-                    rotation += math.sin(sway_phase) * SWAY_ANGLE
-                    offset_x += math.sin(sway_phase * 0.7) * SWAY_X
+                    if (self.pending_max_height is not None
+                            and now >= self.resize_settle_time):
+                        self.max_height = self.pending_max_height
+                        self.pending_max_height = None
+                        self.calculate_size(self.current_state)
+                        self.load_state_image(
+                            self.current_state, crossfade=False
+                        )
+                        self.resize_window()
+                        self.update_position(current_pos)
 
-                # Cursor influence: tilt toward mouse
-                if self.cursor_influence_enabled:
+            # Run animations every frame
+            sin = fast_sin  # Local binding for the per-frame math
+            cfg = self.cfg
+            elapsed = now - self.animation_start
+
+            # Initialize transform values
+            rotation = 0.0
+            scale_x = 1.0
+            scale_y = 1.0
+            offset_x = 0.0
+            offset_y = 0.0
+
+            # Floating: subtle vertical sine wave (window position)
+            float_offset = FLOAT_AMPLITUDE * sin(elapsed * FLOAT_FREQ)
+
+            # Breathing: subtle Y-axis scale pulse
+            if cfg.breathing:
+                breath = sin(elapsed * BREATH_FREQ)
+                scale_y = 1.0 + (breath * BREATH_INTENSITY)
+
+            # Sway: gentle rotation and horizontal drift
+            if cfg.sway:
+                sway_turns = elapsed * SWAY_FREQ
+                rotation += sin(sway_turns) * SWAY_ANGLE
+                offset_x += sin(sway_turns * 0.7) * SWAY_X
+
+            # Cursor influence: tilt toward mouse (sampled at 30Hz;
+            # frames in between reuse the last tilt/shift)
+            if cfg.cursor_influence:
+                if now - self.cursor_sample_time >= CURSOR_POLL_INTERVAL:
+                    self.cursor_sample_time = now
                     cursor_x, cursor_y = get_cursor_position()
-                    frame = self.window.frame()
-                    char_x = frame.origin.x + frame.size.width / 2
-                    char_y = frame.origin.y + frame.size.height / 2
-
-                    dx = cursor_x - char_x
-                    dy = cursor_y - char_y
-                    distance = math.sqrt(dx * dx + dy * dy)
-                    falloff = min(1.0, CURSOR_FALLOFF / max(distance, 1))
-                    strength = self.cursor_influence_strength * falloff
-
-                    cursor_tilt = (dx / 500) * CURSOR_TILT_MAX * strength
-                    cursor_shift = (dx / 500) * CURSOR_SHIFT_MAX * strength
-                    rotation += cursor_tilt
-                    offset_x += cursor_shift
-
-                # Transition animations (override base transforms)
-                if self.transition_active and self.transitions_enabled:
-                    t_elapsed = now - self.transition_start
-                    t_progress = min(1.0, t_elapsed / self.transition_duration)
-
-                    if self.transition_type == TRANSITION_BOUNCE:
-                        height = self.transition_params.get('height', 15)
-                        # Bounce up with easing - peak at middle, settle back
-                        if t_progress < 0.3:
-                            # Rise phase
-                            offset_y += height * (t_progress / 0.3)
-                        else:
-                            # Bounce settle phase using easing
-                            settle_progress = (t_progress - 0.3) / 0.7
-                            eased = ease_out_bounce(settle_progress)
-                            offset_y += height * (1.0 - eased)
-
-                    elif self.transition_type == TRANSITION_SHAKE:
-                        intensity = self.transition_params.get('intensity', 8)
-                        cycles = self.transition_params.get('cycles', 3)
-                        # Rapid horizontal oscillation with decay
-                        decay = 1.0 - t_progress
-                        shake = math.sin(
-                            t_progress * cycles * 2 * math.pi
-                        ) * intensity * decay
-                        offset_x += shake
-
-                    elif self.transition_type == TRANSITION_SCALE_POP:
-                        target = self.transition_params.get('scale', 1.08)
-                        # Pop out then back using elastic easing
-                        pop = ease_out_elastic(t_progress)
-                        scale_mult = 1.0 + (target - 1.0) * (1.0 - pop)
-                        scale_x *= scale_mult
-                        scale_y *= scale_mult
-
-                    # End transition when complete
-                    if t_progress >= 1.0:
-                        self.transition_active = False
-
-                # Apply transforms to image view
-                self.image_view_front.updateTransform(
-                    rotation, scale_x, scale_y, offset_x, offset_y
-                )
-
-                # Update window position (floating only)
-                frame = self.window.frame()
-                frame.origin.y = self.base_y + float_offset
-                self.window.setFrame_display_(frame, False)
-
-                # Aura: pulsing glow radius
-                if self.aura_enabled:
-                    aura_wave = 0.5 + 0.5 * math.sin(
-                        2 * math.pi * elapsed / self.aura_period
+                    # Window geometry is tracked; don't query the frame
+                    dx = cursor_x - (self.base_x + self.width / 2)
+                    dy = cursor_y - (self.applied_y + self.height / 2)
+                    falloff = min(
+                        1.0, CURSOR_FALLOFF / max(math.hypot(dx, dy), 1)
                     )
-                    aura_range = self.aura_max_radius - self.aura_min_radius
-                    radius = self.aura_min_radius + aura_range * aura_wave
-                    self.content_view.layer().setShadowRadius_(radius)
+                    pull = dx * cfg.cursor_influence_strength * falloff
+                    self.cursor_tilt = pull * CURSOR_TILT_PER_PX
+                    self.cursor_shift = pull * CURSOR_SHIFT_PER_PX
+                rotation += self.cursor_tilt
+                offset_x += self.cursor_shift
+
+            # Transition animations (override base transforms)
+            if self.transition_active and cfg.transitions:
+                t_elapsed = now - self.transition_start
+                t_progress = min(1.0, t_elapsed / self.transition_duration)
+
+                if self.transition_type == TRANSITION_BOUNCE:
+                    height = self.transition_params.get('height', 15)
+                    # Bounce up with easing - peak at middle, settle back
+                    if t_progress < 0.3:
+                        # Rise phase
+                        offset_y += height * (t_progress / 0.3)
+                    else:
+                        # Bounce settle phase using easing
+                        settle_progress = (t_progress - 0.3) / 0.7
+                        eased = ease_out_bounce(settle_progress)
+                        offset_y += height * (1.0 - eased)
+
+                elif self.transition_type == TRANSITION_SHAKE:
+                    intensity = self.transition_params.get('intensity', 8)
+                    cycles = self.transition_params.get('cycles', 3)
+                    # Rapid horizontal oscillation with decay
+                    decay = 1.0 - t_progress
+                    shake = math.sin(
+                        t_progress * cycles * 2 * math.pi
+                    ) * intensity * decay
+                    offset_x += shake
+
+                elif self.transition_type == TRANSITION_SCALE_POP:
+                    target = self.transition_params.get('scale', 1.08)
+                    # Pop out then back using elastic easing
+                    pop = ease_out_elastic(t_progress)
+                    scale_mult = 1.0 + (target - 1.0) * (1.0 - pop)
+                    scale_x *= scale_mult
+                    scale_y *= scale_mult
+
+                # End transition when complete
+                if t_progress >= 1.0:
+                    self.transition_active = False
+
+            # Apply transforms to image view
+            self.image_view_front.updateTransform(
+                rotation, scale_x, scale_y, offset_x, offset_y
+            )
 
-                # Update emotion overlay animation
-                if self.emotions_enabled and self.emotion_view.emotions:
-                    self.emotion_view.setAnimationPhase_(elapsed)
+            # Update window position (floating only); sub-pixel steps
+            # are skipped so slow parts of the wave cost no frame push.
+            # Size is unchanged here, so only the origin crosses over.
+            new_y = self.base_y + float_offset
+            if abs(new_y - self.applied_y) >= FLOAT_MIN_STEP:
+                self.applied_y = new_y
+                self.window.setFrameOrigin_((self.base_x, new_y))
+
+            # Update emotion overlay animation
+            if cfg.emotions and self.emotion_view.emotions:
+                self.emotion_view.setAnimationPhase_(elapsed)
 
         except Exception:
             pass
@@ -1950,136 +2764,164 @@ class Overlay(NSObject):
         """Show window after run loop has started."""
         self.window.setAlphaValue_(1.0)
         self.window.orderFront_(None)
+        self.window_ordered_in = True
+
+    @objc.python_method
+    def bind_fade_methods(self):
+        """Point fadeIn/fadeOut at the variant for cfg.fade_animation.
+
+        The flag only changes on a settings reload, so each fade runs its
+        own path without re-testing it.
+        """
+        if self.cfg.fade_animation:
+            self.fadeIn = self.fade_in_animated
+            self.fadeOut = self.fade_out_animated
+        else:
+            self.fadeIn = self.fade_in_immediate
+            self.fadeOut = self.fade_out_immediate
+
+    @objc.python_method
+    def order_in_for_fade(self):
+        """Get the window on screen (or keep it there) before a fade-in."""
+        # Drop the orderOut still queued by a fade-out this one interrupts
+        NSObject.cancelPreviousPerformRequestsWithTarget_selector_object_(
+            self, 'hideWindow:', None
+        )
+        if not self.window_ordered_in:
+            self.window.setAlphaValue_(0.0)
+            self.window.orderFront_(None)
+            self.window_ordered_in = True
+        # else: still on screen mid fade-out; fade back from current alpha
 
-    def fadeIn(self):
+    @objc.python_method
+    def fade_in_animated(self):
         """Smoothly show the overlay."""
         if self.is_visible:
             return
-        self.window.setAlphaValue_(0.0)
-        self.window.orderFront_(None)
-        if self.fade_animation:
-            NSAnimationContext.beginGrouping()
-            try:
-                ctx = NSAnimationContext.currentContext()
-                ctx.setDuration_(FADE_DURATION)
-                self.window.animator().setAlphaValue_(1.0)
-            finally:
-                NSAnimationContext.endGrouping()
-        else:
-            self.window.setAlphaValue_(1.0)
+        self.order_in_for_fade()
+        NSAnimationContext.beginGrouping()
+        try:
+            ctx = NSAnimationContext.currentContext()
+            ctx.setDuration_(FADE_DURATION)
+            self.window.animator().setAlphaValue_(1.0)
+        finally:
+            NSAnimationContext.endGrouping()
         self.is_visible = True
+        self.start_animation_driver()
 
-    def fadeOut(self):
+    @objc.python_method
+    def fade_in_immediate(self):
+        """Show the overlay at once (fade animation disabled)."""
+        if self.is_visible:
+            return
+        self.order_in_for_fade()
+        self.window.setAlphaValue_(1.0)
+        self.is_visible = True
+        self.start_animation_driver()
+
+    @objc.python_method
+    def fade_out_animated(self):
         """Smoothly hide the overlay."""
         if not self.is_visible:
             return
-        if self.fade_animation:
-            NSAnimationContext.beginGrouping()
-            try:
-                ctx = NSAnimationContext.currentContext()
-                ctx.setDuration_(FADE_DURATION)
-                self.window.animator().setAlphaValue_(0.0)
-            finally:
-                NSAnimationContext.endGrouping()
-            # Schedule orderOut after animation
-            timer_method = 'scheduledTimerWithTimeInterval_' \
-                'target_selector_userInfo_repeats_'
-            getattr(NSTimer, timer_method)(
-                FADE_DURATION, self, 'hideWindow:', None, False
-            )
-        else:
-            self.window.setAlphaValue_(0.0)
-            self.window.orderOut_(None)
+        NSAnimationContext.beginGrouping()
+        try:
+            ctx = NSAnimationContext.currentContext()
+            ctx.setDuration_(FADE_DURATION)
+            self.window.animator().setAlphaValue_(0.0)
+        finally:
+            NSAnimationContext.endGrouping()
+        # Schedule orderOut after animation
+        self.performSelector_withObject_afterDelay_(
+            'hideWindow:', None, FADE_DURATION
+        )
+        self.is_visible = False
+
+    @objc.python_method
+    def fade_out_immediate(self):
+        """Hide the overlay at once (fade animation disabled)."""
+        if not self.is_visible:
+            return
+        self.window.setAlphaValue_(0.0)
+        self.window.orderOut_(None)
+        self.window_ordered_in = False
+        self.pause_animation_driver()
         self.is_visible = False
 
+    @objc.python_method
+    def hide_now(self):
+        """Fade out and drop any pending decision that could undo it.
+
+        fadeOut() is a no-op unless visible, so bursts of hide requests
+        (and a fade-out already underway) cost no further AppKit calls.
+        """
+        self.cancel_visibility_decision()
+        self.fadeOut()
+
     def hideWindow_(self, timer):
         """Called after fade out animation to hide window."""
         if not self.is_visible:
             self.window.orderOut_(None)
+            self.window_ordered_in = False
+            # Nothing on screen to animate until the next fadeIn
+            self.pause_animation_driver()
 
     def appDidActivate_(self, notification):
         """Called instantly when any app becomes frontmost."""
-        try:
-            app = notification.userInfo()['NSWorkspaceApplicationKey']
-            active_pid = app.processIdentifier()
-
-            if active_pid != self.terminal_pid:
-                # Different app - HIDE IMMEDIATELY
-                self.cancel_pending_show()
-                if self.is_visible:
-                    self.fadeOut()
-            else:
-                # Our terminal - schedule debounced show check
-                self.schedule_show_check()
-        except Exception:
-            # On any error, hide to be safe
-            self.cancel_pending_show()
-            if self.is_visible:
-                self.fadeOut()
-
-    def schedule_show_check(self):
-        """Debounce: wait 50ms before showing to prevent flashing."""
-        self.cancel_pending_show()
-        m = 'scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_'
-        self.pending_show_timer = getattr(NSTimer, m)(
-            0.05, self, 'verifyAndShow:', None, False
-        )
-
-    def cancel_pending_show(self):
-        """Cancel any pending show timer."""
-        if self.pending_show_timer:
-            self.pending_show_timer.invalidate()
-            self.pending_show_timer = None
-
-    def verifyAndShow_(self, timer):
-        """Verify our terminal is focused before showing."""
-        self.pending_show_timer = None
-        # is_our_window_frontmost handles both cases:
-        # - window_id known: check specific window is frontmost
-        # - window_id unknown: permissive (show if terminal app frontmost)
-        if is_our_window_frontmost(self.terminal_pid, self.terminal_window_id):
-            if not self.is_visible:
-                self.fadeIn()
+        # Most activations are unrelated apps while we're already hidden
+        if (not self.is_visible and not self.decision_pending
+                and notification_app_pid(notification) != self.terminal_pid):
+            return
+        self.schedule_visibility_decision()
 
-    def appDidDeactivate_(self, notification):
-        """Called when app loses focus - hide if our terminal deactivated."""
-        try:
-            app = notification.userInfo()['NSWorkspaceApplicationKey']
-            deactivated_pid = app.processIdentifier()
-
-            if deactivated_pid == self.terminal_pid:
-                # Our terminal lost focus - hide immediately
-                self.cancel_pending_show()
-                if self.is_visible:
-                    self.fadeOut()
-        except Exception:
-            pass
+    def terminalAppChanged_(self, notification):
+        """An app lost focus, was hidden or unhidden - re-check if ours."""
+        # Other apps losing focus is covered by the paired activation
+        if notification_app_pid(notification) == self.terminal_pid:
+            self.schedule_visibility_decision()
 
     def spaceDidChange_(self, notification):
         """Called when user switches Spaces - re-check visibility."""
-        # Delay check slightly to let Space switch complete
-        m = 'scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_'
-        getattr(NSTimer, m)(
-            0.1, self, 'checkVisibilityAfterSpaceChange:', None, False
-        )
+        # Give the Space switch time to complete before deciding
+        self.schedule_visibility_decision(SPACE_SETTLE_DELAY)
 
-    def checkVisibilityAfterSpaceChange_(self, timer):
-        """Check visibility after Space change."""
-        if not self.terminal_window_id:
-            return
+    @objc.python_method
+    def schedule_visibility_decision(self, delay: float = VISIBILITY_DEBOUNCE):
+        """Coalesce focus/Space events; only the settled state is applied.
+
+        A burst (cmd-tab chains, Mission Control) restarts the timer so one
+        window-list query and at most one fade run once things settle.
+        """
+        invalidate_frontmost_cache()
+        now = time.monotonic()
+        due = now + delay
+        if self.decision_pending:
+            # Never cut short a longer settle requested earlier (Space)
+            due = max(due, self.decision_due)
+            self.cancel_visibility_decision()
+        self.decision_due = due
+        self.decision_pending = True
+        # A perform request on the run loop; no NSTimer per event
+        self.performSelector_withObject_afterDelay_(
+            'applyVisibilityDecision:', None, due - now
+        )
 
-        # Check if our window is on-screen (on current Space)
-        window_on_screen = self._is_window_on_screen(self.terminal_window_id)
+    def cancel_visibility_decision(self):
+        """Cancel any pending visibility decision."""
+        if self.decision_pending:
+            self.decision_pending = False
+            NSObject.cancelPreviousPerformRequestsWithTarget_selector_object_(
+                self, 'applyVisibilityDecision:', None
+            )
 
-        if not window_on_screen:
-            self.cancel_pending_show()
-            if self.is_visible:
-                self.fadeOut()
-        elif is_our_window_frontmost(
-            self.terminal_pid, self.terminal_window_id
-        ):
-            if not self.is_visible:
-                self.schedule_show_check()
+    def applyVisibilityDecision_(self, timer):
+        """Show only if our terminal window is on screen and frontmost."""
+        self.decision_pending = False
+        # Answers polled during the debounce may predate the settled
+        # state; query afresh and leave the result cached so the tick and
+        # validateVisibility_ reuse it instead of asking Quartz again
+        invalidate_frontmost_cache()
+        self.recheck_visibility(settled=True)
 
     def validateVisibility_(self, timer):
         """Periodic ground-truth check via Quartz (catches minimize, etc.)."""
@@ -2087,68 +2929,49 @@ class Overlay(NSObject):
             return
 
         # Skip during startup grace period
-        if (time.time() - self.startup_time) < STARTUP_GRACE_PERIOD:
+        if (time.monotonic() - self.startup_time) < STARTUP_GRACE_PERIOD:
             return
 
-        # Check if window is on-screen (catches minimize, Space change)
-        window_on_screen = self._is_window_on_screen(self.terminal_window_id)
-
-        if not window_on_screen:
-            # Window minimized or on different Space
-            self.cancel_pending_show()
-            if self.is_visible:
-                self.fadeOut()
-        elif is_our_window_frontmost(
-            self.terminal_pid, self.terminal_window_id
-        ):
-            # Window visible and frontmost - ensure overlay shown
-            if not self.is_visible:
-                self.fadeIn()
+        self.recheck_visibility(settled=False)
+
+    @objc.python_method
+    def recheck_visibility(self, settled: bool):
+        """Show or hide from our terminal window's on-screen/focus state.
+
+        A settled focus/Space decision also hides when another window is
+        frontmost; the periodic backstop only hides once ours has left
+        the screen (minimized, hidden or on another Space).
+        """
+        window_id = self.terminal_window_id
+        if window_id and not self._is_window_on_screen(window_id):
+            self.hide_now()
+        # is_our_window_frontmost handles both cases:
+        # - window_id known: check specific window is frontmost
+        # - window_id unknown: permissive (terminal app frontmost)
+        elif is_our_window_frontmost_cached(self.terminal_pid, window_id):
+            self.fadeIn()
+        elif settled:
+            self.hide_now()
 
     def _is_window_on_screen(self, window_id: int) -> bool:
         """Check if a window is currently visible on screen."""
         if not window_id:
             return False
-        try:
-            opts = (kCGWindowListOptionOnScreenOnly |
-                    kCGWindowListExcludeDesktopElements)
-            windows = CGWindowListCopyWindowInfo(opts, kCGNullWindowID)
-            if windows:
-                for w in windows:
-                    if w.get('kCGWindowNumber') == window_id:
-                        return True
-        except Exception:
-            pass
-        return False
+        return get_window_state(window_id) is True
 
     def _is_window_valid(self, window_id: int) -> bool:
         """Check if a window ID exists (including off-screen/minimized)."""
         if not window_id:
             return False
-        try:
-            # Query ALL windows, not just on-screen
-            windows = CGWindowListCopyWindowInfo(0, kCGNullWindowID)
-            if windows:
-                for w in windows:
-                    if w.get('kCGWindowNumber') == window_id:
-                        return True
-        except Exception:
-            pass
-        return False
+        # Exists at all, including off-screen/minimized
+        return get_window_state(window_id) is not None
 
     def run(self):
         """Start the overlay."""
         try:
             self.app.run()
         finally:
-            # Clean up socket on exit
-            if self.socket_server:
-                self.socket_server.close()
-            if self.socket_path.exists():
-                self.socket_path.unlink(missing_ok=True)
-            # Clean up PID file
-            if hasattr(self, 'pid_path') and self.pid_path.exists():
-                self.pid_path.unlink(missing_ok=True)
+            self._teardown()
 
 
 def main():
@@ -144,6 +144,8 @@ def mock_pyobjc():
     )
     mocks["Quartz"].kCGWindowListOptionOnScreenOnly = 1
     mocks["Quartz"].kCGNullWindowID = 0
+    mocks["Quartz"].kCGWindowIsOnscreen = "kCGWindowIsOnscreen"
+    mocks["Quartz"].kCGWindowListOptionIncludingWindow = 8
 
     with patch.dict(sys.modules, mocks):
         yield mocks
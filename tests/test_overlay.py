@@ -37,6 +37,8 @@ def create_pyobjc_mocks():
     mock_quartz.kCGWindowListOptionOnScreenOnly = 1
     mock_quartz.kCGWindowListExcludeDesktopElements = 16
     mock_quartz.kCGNullWindowID = 0
+    mock_quartz.kCGWindowIsOnscreen = "kCGWindowIsOnscreen"
+    mock_quartz.kCGWindowListOptionIncludingWindow = 8
     mock_quartz.CGColorCreateGenericRGB = MagicMock()
 
     # Mock Foundation with NSObject base class
@@ -312,6 +314,203 @@ class TestGetTerminalPosition:
         assert result == {"x": 100, "y": 100, "w": 800, "h": 600}
 
 
+class TestGetTerminalPositionCached:
+    """Tests for get_terminal_position_cached() function."""
+
+    def test_reuses_result_within_ttl(self, overlay_module, mocker):
+        """Quartz is queried once while the cache is fresh."""
+        mock_get = mocker.patch.object(
+            overlay_module,
+            "get_terminal_position",
+            return_value={"x": 1, "y": 2, "w": 3, "h": 4}
+        )
+
+        first = overlay_module.get_terminal_position_cached()
+        second = overlay_module.get_terminal_position_cached()
+
+        assert first == second == {"x": 1, "y": 2, "w": 3, "h": 4}
+        mock_get.assert_called_once()
+
+    def test_refreshes_after_ttl(self, overlay_module, mocker):
+        """Expired cache triggers a new lookup."""
+        mock_get = mocker.patch.object(
+            overlay_module,
+            "get_terminal_position",
+            return_value={"x": 1, "y": 2, "w": 3, "h": 4}
+        )
+
+        overlay_module.get_terminal_position_cached()
+        overlay_module._terminal_pos_cache_time -= (
+            overlay_module.TERMINAL_POSITION_CACHE_TTL + 1
+        )
+        overlay_module.get_terminal_position_cached()
+
+        assert mock_get.call_count == 2
+
+
+class TestGetWindowSnapshot:
+    """Tests for get_window_snapshot() function."""
+
+    def test_shared_within_frame(self, overlay_module, mocker):
+        """Lookups in the same frame reuse one Quartz window list."""
+        windows = [{"kCGWindowNumber": 7}]
+        mock_copy = mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo", return_value=windows
+        )
+
+        assert overlay_module.get_window_snapshot() is windows
+        assert overlay_module.get_window_snapshot() is windows
+        mock_copy.assert_called_once()
+
+    def test_refreshes_next_frame(self, overlay_module, mocker):
+        """An expired snapshot is fetched again."""
+        mock_copy = mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo", return_value=[]
+        )
+
+        overlay_module.get_window_snapshot()
+        overlay_module._window_snapshot_time -= (
+            overlay_module.WINDOW_SNAPSHOT_TTL + 1
+        )
+        overlay_module.get_window_snapshot()
+
+        assert mock_copy.call_count == 2
+
+    def test_position_lookup_uses_given_list(self, overlay_module, mocker):
+        """A pre-fetched list skips the Quartz call."""
+        mock_copy = mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo"
+        )
+        windows = [{
+            "kCGWindowNumber": 5,
+            "kCGWindowBounds": {"X": 1, "Y": 2, "Width": 3, "Height": 4},
+        }]
+
+        pos = overlay_module.get_terminal_window_position(5, windows)
+
+        assert pos == {"x": 1, "y": 2, "w": 3, "h": 4}
+        mock_copy.assert_not_called()
+
+
+class TestIsOurWindowFrontmostCached:
+    """Tests for is_our_window_frontmost_cached() function."""
+
+    def test_reuses_result_within_ttl(self, overlay_module, mocker):
+        """Repeated polls for the same window share one check."""
+        mock_check = mocker.patch.object(
+            overlay_module, "is_our_window_frontmost", return_value=True
+        )
+
+        assert overlay_module.is_our_window_frontmost_cached(1, 2) is True
+        assert overlay_module.is_our_window_frontmost_cached(1, 2) is True
+
+        mock_check.assert_called_once()
+
+    def test_keyed_by_pid_and_window(self, overlay_module, mocker):
+        """A different terminal window is checked separately."""
+        mock_check = mocker.patch.object(
+            overlay_module, "is_our_window_frontmost",
+            side_effect=[True, False]
+        )
+
+        assert overlay_module.is_our_window_frontmost_cached(1, 2) is True
+        assert overlay_module.is_our_window_frontmost_cached(1, 3) is False
+        assert mock_check.call_count == 2
+
+    def test_invalidate_forces_recheck(self, overlay_module, mocker):
+        """Invalidation (focus change) drops the cached answer."""
+        mock_check = mocker.patch.object(
+            overlay_module, "is_our_window_frontmost",
+            side_effect=[True, False]
+        )
+
+        overlay_module.is_our_window_frontmost_cached(1, 2)
+        overlay_module.invalidate_frontmost_cache()
+
+        assert overlay_module.is_our_window_frontmost_cached(1, 2) is False
+        assert mock_check.call_count == 2
+
+
+class TestGetWindowState:
+    """Tests for get_window_state() function."""
+
+    def test_queries_single_window(self, overlay_module, mocker):
+        """Asks Quartz about the one window, not the whole window list."""
+        mock_copy = mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo",
+            return_value=[{"kCGWindowNumber": 7, "kCGWindowIsOnscreen": 1}]
+        )
+
+        assert overlay_module.get_window_state(7) is True
+        mock_copy.assert_called_once_with(
+            overlay_module.kCGWindowListOptionIncludingWindow, 7
+        )
+
+    def test_off_screen_and_missing(self, overlay_module, mocker):
+        """Off-screen windows are False; windows that are gone are None."""
+        mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo",
+            side_effect=[[{"kCGWindowNumber": 7}], []]
+        )
+
+        assert overlay_module.get_window_state(7) is False
+        assert overlay_module.get_window_state(8) is None
+
+    def test_reuses_answer_within_ttl(self, overlay_module, mocker):
+        """Repeated checks share one Quartz query per TTL."""
+        mock_copy = mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo",
+            return_value=[{"kCGWindowNumber": 7, "kCGWindowIsOnscreen": 1}]
+        )
+
+        overlay_module.get_window_state(7)
+        overlay_module.get_window_state(7)
+        mock_copy.assert_called_once()
+
+    def test_invalidated_on_focus_change(self, overlay_module, mocker):
+        """Focus/Space invalidation forces a fresh query."""
+        mock_copy = mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo", return_value=[]
+        )
+
+        overlay_module.get_window_state(7)
+        overlay_module.invalidate_frontmost_cache()
+        overlay_module.get_window_state(7)
+
+        assert mock_copy.call_count == 2
+
+    def test_query_failure_not_cached(self, overlay_module, mocker):
+        """A failed Quartz query reads as missing and is retried."""
+        mock_copy = mocker.patch.object(
+            overlay_module, "CGWindowListCopyWindowInfo",
+            side_effect=[RuntimeError("quartz"), [{"kCGWindowNumber": 7}]]
+        )
+
+        assert overlay_module.get_window_state(7) is None
+        assert overlay_module.get_window_state(7) is False
+        assert mock_copy.call_count == 2
+
+
+class TestNotificationAppPid:
+    """Tests for notification_app_pid() function."""
+
+    def test_reads_application_pid(self, overlay_module):
+        """Returns the PID of the notification's application."""
+        app = MagicMock()
+        app.processIdentifier.return_value = 4321
+        note = MagicMock()
+        note.userInfo.return_value.objectForKey_.return_value = app
+
+        assert overlay_module.notification_app_pid(note) == 4321
+
+    def test_missing_application(self, overlay_module):
+        """Returns None when the notification carries no application."""
+        note = MagicMock()
+        note.userInfo.return_value.objectForKey_.return_value = None
+
+        assert overlay_module.notification_app_pid(note) is None
+
+
 class TestIsOurWindowFrontmost:
     """Tests for is_our_window_frontmost() function."""
 
@@ -227,6 +227,66 @@ class TestAnimationCalculations:
         assert abs(rotation - overlay_module.SWAY_ANGLE) < 0.001
 
 
+class TestFastSin:
+    """Tests for the table-based fast_sin()/fast_cos() helpers."""
+
+    def test_matches_math_sin(self, overlay_module):
+        """Table lookup stays within one step of math.sin."""
+        step = 2 * math.pi / overlay_module.SIN_TABLE_SIZE
+        for i in range(200):
+            turns = i * 0.0137
+            expected = math.sin(2 * math.pi * turns)
+            assert abs(overlay_module.fast_sin(turns) - expected) <= step
+
+    def test_periodic_and_negative_phases(self, overlay_module):
+        """Whole turns and negative phases wrap around the table."""
+        assert overlay_module.fast_sin(0.25) == 1.0
+        assert overlay_module.fast_sin(3.25) == 1.0
+        assert overlay_module.fast_sin(-0.25) == -1.0
+
+    def test_cos_is_quarter_turn_shift(self, overlay_module):
+        """fast_cos is fast_sin shifted by a quarter turn."""
+        assert overlay_module.fast_cos(0.0) == 1.0
+        assert overlay_module.fast_cos(0.5) == -1.0
+
+
+class TestStarPath:
+    """Tests for the shared star path."""
+
+    def test_built_once(self, overlay_module):
+        """Repeated calls reuse the path instead of rebuilding it."""
+        overlay_module.CGPathCreateMutable.reset_mock()
+
+        first = overlay_module.get_star_path()
+        second = overlay_module.get_star_path()
+
+        assert first is second
+        assert overlay_module.CGPathCreateMutable.call_count == 1
+
+    def test_star_emotions_are_layer_rendered(self, overlay_module):
+        """Sparkle and star no longer go through drawRect_."""
+        assert {'sparkle', 'star', 'zzz'} <= overlay_module.LAYER_EMOTIONS
+        assert 'focus_lines' not in overlay_module.LAYER_EMOTIONS
+
+
+class TestRelaxTimer:
+    """Tests for relax_timer() tolerance helper."""
+
+    def test_tolerance_is_quarter_interval(self, overlay_module):
+        """Short timers get a quarter of their interval as slack."""
+        timer = MagicMock()
+        assert overlay_module.relax_timer(timer, 0.5) is timer
+        timer.setTolerance_.assert_called_once_with(0.125)
+
+    def test_tolerance_is_capped(self, overlay_module):
+        """Long timers never drift by more than the cap."""
+        timer = MagicMock()
+        overlay_module.relax_timer(timer, 10.0)
+        timer.setTolerance_.assert_called_once_with(
+            overlay_module.MAX_TIMER_TOLERANCE
+        )
+
+
 class TestEasingFunctions:
     """Tests for animation easing functions."""
 
@@ -112,6 +112,14 @@ class TestConstants:
         assert overlay.SWAY_ANGLE == 1.5
         assert overlay.SWAY_PERIOD == 4.0
 
+    def test_resize_filters_include_default(self, overlay):
+        """Default runtime resize filter is a known filter name."""
+        assert overlay.DEFAULT_RESIZE_FILTER in overlay.RESAMPLE_FILTERS
+        assert (
+            overlay.RESAMPLE_FILTERS['lanczos']
+            == Image.Resampling.LANCZOS
+        )
+
     def test_default_messages_has_all_states(self, overlay):
         """DEFAULT_MESSAGES includes all states."""
         expected = {
@@ -186,6 +194,62 @@ class TestLoadSettings:
         assert result == {}
 
 
+# =============================================================================
+# OVERLAY_CONFIG TESTS
+# =============================================================================
+
+
+class TestOverlayConfig:
+    """Tests for OverlayConfig.from_settings()."""
+
+    def test_defaults_for_empty_settings(self, overlay):
+        """Missing sections fall back to documented defaults."""
+        cfg = overlay.OverlayConfig.from_settings({})
+
+        assert cfg.max_height == overlay.DEFAULT_MAX_HEIGHT
+        assert cfg.custom_x is None
+        assert cfg.gradient_percentage == 0.8
+        assert cfg.breathing is True
+        assert cfg.speech == {}
+        assert cfg.aura_period == overlay.AURA_PERIOD
+        assert cfg.character_folder == 'characters'
+
+    def test_reads_nested_values(self, overlay):
+        """Values from each settings section are flattened onto the config."""
+        cfg = overlay.OverlayConfig.from_settings({
+            'overlay': {'maxHeight': 250, 'customX': 40, 'customY': 60,
+                        'bottomGradient': {'enabled': False}},
+            'immersion': {'sway': False, 'cursorInfluenceStrength': 0.9},
+            'audio': {'volume': 0.2},
+            'characterFolder': 'characters2',
+        })
+
+        assert cfg.max_height == 250
+        assert (cfg.custom_x, cfg.custom_y) == (40, 60)
+        assert cfg.gradient_enabled is False
+        assert cfg.use_gradient is False
+        assert cfg.sway is False
+        assert cfg.cursor_influence_strength == 0.9
+        assert cfg.audio_volume == 0.2
+        assert cfg.character_folder == 'characters2'
+
+    def test_aura_pulse_settings(self, overlay):
+        """Aura pulse range and period come from the aura settings."""
+        cfg = overlay.OverlayConfig.from_settings({
+            'aura': {'minRadius': 4.0, 'maxRadius': 10.0, 'period': 2.0},
+        })
+
+        assert (cfg.aura_min_radius, cfg.aura_max_radius) == (4.0, 10.0)
+        assert cfg.aura_period == 2.0
+
+    def test_uses_slots(self, overlay):
+        """Config rejects attributes outside its declared fields."""
+        cfg = overlay.OverlayConfig.from_settings({})
+
+        with pytest.raises(AttributeError):
+            cfg.unknown = True
+
+
 # =============================================================================
 # APPLY_BOTTOM_GRADIENT TESTS
 # =============================================================================
@@ -223,6 +287,25 @@ class TestApplyBottomGradient:
         r, g, b, a = result.getpixel((5, 99))
         assert a < 10  # Nearly transparent
 
+    def test_gradient_is_linear_over_band(self, overlay):
+        """Alpha falls off linearly from band start to bottom."""
+        img = Image.new('RGBA', (4, 100), (0, 255, 0, 255))
+        result = overlay.apply_bottom_gradient(img, 0.5)
+
+        # Band starts at y=50; halfway through it alpha is about half
+        assert result.getpixel((0, 50))[3] == 255
+        assert abs(result.getpixel((3, 75))[3] - 127) <= 1
+        # Color channels are untouched
+        assert result.getpixel((2, 99))[:3] == (0, 255, 0)
+
+    def test_gradient_ramp_reused_per_size(self, overlay):
+        """The band ramp is built once per (width, height)."""
+        ramp = overlay.gradient_ramp(4, 50)
+
+        assert overlay.gradient_ramp(4, 50) is ramp
+        assert ramp.size == (4, 50)
+        assert ramp.getpixel((0, 0)) == 255
+
     def test_gradient_converts_rgb_to_rgba(self, overlay):
         """Converts RGB images to RGBA."""
         img = Image.new('RGB', (10, 10), (255, 0, 0))
@@ -430,43 +513,6 @@ class TestIsOurWindowFrontmost:
         pytest.skip("Requires complex PyObjC mocking")
 
 
-# =============================================================================
-# GENERATE_SHADOW_IMAGE TESTS
-# =============================================================================
-
-
-class TestGenerateShadowImage:
-    """Tests for generate_shadow_image() function."""
-
-    def test_generates_shadow_from_rgba(self, overlay):
-        """Generates shadow from RGBA image."""
-        img = Image.new('RGBA', (50, 50), (255, 0, 0, 255))
-        result = overlay.generate_shadow_image(img, blur=5, opacity=0.3)
-
-        assert result.mode == 'RGBA'
-        assert result.size == (50, 50)
-
-    def test_generates_shadow_from_rgb(self, overlay):
-        """Converts RGB to RGBA before generating shadow."""
-        img = Image.new('RGB', (50, 50), (255, 0, 0))
-        result = overlay.generate_shadow_image(img, blur=5, opacity=0.3)
-
-        assert result.mode == 'RGBA'
-
-    def test_shadow_has_transparency(self, overlay):
-        """Generated shadow has semi-transparent pixels."""
-        # Create image with solid center, transparent edges
-        img = Image.new('RGBA', (100, 100), (0, 0, 0, 0))
-        center = Image.new('RGBA', (50, 50), (255, 255, 255, 255))
-        img.paste(center, (25, 25))
-
-        result = overlay.generate_shadow_image(img, blur=5, opacity=0.5)
-
-        # Center should have shadow (non-zero alpha)
-        _, _, _, a = result.getpixel((50, 50))
-        assert a > 0
-
-
 # =============================================================================
 # PIL_TO_NSIMAGE TESTS
 # =============================================================================
@@ -486,6 +532,15 @@ class TestPilToNsimage:
         # Should return an NSImage mock (from Cocoa.NSImage)
         assert result is not None
 
+    def test_builds_cgimage_from_raw_rgba(self, overlay):
+        """Passes raw RGBA geometry to CGImageCreate (RGB is converted)."""
+        img = Image.new('RGB', (50, 20), (255, 0, 0))
+
+        overlay.pil_to_nsimage(img)
+
+        args = overlay.CGImageCreate.call_args[0]
+        assert args[:5] == (50, 20, 8, 32, 200)
+
 
 # =============================================================================
 # GET_CURSOR_POSITION TESTS
@@ -513,3 +568,74 @@ class TestGetCursorPosition:
         result = overlay.get_cursor_position()
 
         assert result == (0, 0)
+
+
+# =============================================================================
+# SPLIT_MESSAGES TESTS
+# =============================================================================
+
+
+class TestSplitMessages:
+    """Tests for split_messages() function."""
+
+    def test_keeps_partial_message(self, overlay):
+        """Incomplete data stays buffered until its newline arrives."""
+        pending = bytearray(b'{"cmd": ')
+
+        assert overlay.split_messages(pending) == []
+        pending += b'"PING"}\n'
+        assert overlay.split_messages(pending) == [b'{"cmd": "PING"}']
+        assert pending == bytearray()
+
+    def test_yields_batched_messages(self, overlay):
+        """Several framed messages in one read come out in order."""
+        pending = bytearray(b'{"a": 1}\n{"b": 2}\n{"c"')
+
+        result = overlay.split_messages(pending)
+
+        assert result == [b'{"a": 1}', b'{"b": 2}']
+        assert pending == bytearray(b'{"c"')
+
+    def test_skips_blank_lines(self, overlay):
+        """Empty frames are ignored."""
+        pending = bytearray(b'\n{"a": 1}\n\n')
+
+        assert overlay.split_messages(pending) == [b'{"a": 1}']
+        assert pending == bytearray()
+
+
+class TestReadPngSize:
+    """Tests for read_png_size() function."""
+
+    def test_reads_header_dimensions(self, overlay, tmp_path):
+        """Width and height come from the IHDR chunk."""
+        path = tmp_path / "frame.png"
+        Image.new('RGBA', (37, 81)).save(path)
+
+        assert overlay.read_png_size(path) == (37, 81)
+
+    def test_non_png_returns_none(self, overlay, tmp_path):
+        """Other formats and missing files fall back to the caller."""
+        path = tmp_path / "frame.gif"
+        Image.new('RGB', (10, 10)).save(path)
+
+        assert overlay.read_png_size(path) is None
+        assert overlay.read_png_size(tmp_path / "missing.png") is None
+
+
+class TestSocketCodec:
+    """Tests for decode_message() and encode_reply() functions."""
+
+    def test_round_trip(self, overlay):
+        """A reply decodes back to the original payload."""
+        reply = overlay.encode_reply({"status": "ok", "n": 1})
+
+        assert reply.endswith(b'\n')
+        assert overlay.decode_message(reply) == {"status": "ok", "n": 1}
+
+    def test_stdlib_fallback(self, overlay, monkeypatch):
+        """Without orjson the stdlib codec is used."""
+        monkeypatch.setattr(overlay, "orjson", None)
+
+        assert overlay.encode_reply({"a": 1}) == b'{"a": 1}\n'
+        assert overlay.decode_message(b'{"a": 1}') == {"a": 1}
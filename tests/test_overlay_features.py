@@ -237,6 +237,26 @@ class TestHexToNscolor:
         color = overlay_module.hex_to_nscolor("fff")
         assert color is not None
 
+    def test_repeated_color_is_memoized(self, overlay_module):
+        """The same hex string returns the cached NSColor."""
+        first = overlay_module.hex_to_nscolor("#123456")
+        second = overlay_module.hex_to_nscolor("#123456")
+        assert first is second
+        assert overlay_module.hex_to_nscolor.cache_info().hits >= 1
+
+
+class TestHexToRgba:
+    """Tests for hex_to_rgba() function."""
+
+    def test_parses_components(self, overlay_module):
+        """Splits a hex string into 0.0-1.0 channels plus alpha."""
+        rgba = overlay_module.hex_to_rgba("#ff8000", 0.5)
+        assert rgba == (1.0, 128 / 255.0, 0.0, 0.5)
+
+    def test_invalid_length_returns_white(self, overlay_module):
+        """Falls back to white for malformed input."""
+        assert overlay_module.hex_to_rgba("fff") == (1.0, 1.0, 1.0, 1.0)
+
 
 class TestSpeechBubbleSettings:
     """Tests for speech bubble default settings."""